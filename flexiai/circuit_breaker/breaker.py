@@ -341,6 +341,19 @@ class CircuitBreaker:
         with self._lock:
             return self.state.state == CircuitState.OPEN
 
+    def is_open_fast(self) -> bool:
+        """
+        Check if circuit is open without acquiring the lock.
+
+        State is only written under the lock, and reading a single attribute
+        is atomic, so this is safe for hot paths such as provider selection
+        that can tolerate a momentarily stale answer.
+
+        Returns:
+            True if circuit is OPEN, False otherwise
+        """
+        return self.state.state is CircuitState.OPEN
+
     def is_closed(self) -> bool:
         """
         Check if circuit is currently closed.
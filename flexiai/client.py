@@ -191,17 +191,19 @@ class FlexiAI:
         if not self.config or not self.config.providers:
             return
 
-        for provider_config in self.config.providers:
-            # Create provider instance based on name
-            provider = self._create_provider(provider_config)
-
-            # Register with circuit breaker config and sync manager
-            self.registry.register(
-                provider=provider,
-                circuit_breaker_config=self.config.circuit_breaker,
-                sync_manager=self._sync_manager,
-            )
+        # Create provider instances based on name
+        providers = [
+            self._create_provider(provider_config) for provider_config in self.config.providers
+        ]
+
+        # Register the batch with circuit breaker config and sync manager
+        self.registry.register_many(
+            providers,
+            circuit_breaker_config=self.config.circuit_breaker,
+            sync_manager=self._sync_manager,
+        )
 
+        for provider_config in self.config.providers:
             self.logger.info(
                 f"Registered provider '{provider_config.name}' "
                 f"with model '{provider_config.model}' (priority: {provider_config.priority})"
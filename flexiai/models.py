@@ -6,6 +6,7 @@ and validation. All models use Pydantic v2 for schema validation and serializati
 """
 
 from enum import Enum
+from operator import attrgetter
 from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field, field_validator, model_validator
@@ -452,22 +453,23 @@ class FlexiAIConfig(BaseModel):
         if not v:
             raise ValueError("At least one provider must be configured")
 
-        # Check for duplicate priorities
-        priorities = [p.priority for p in v]
-        if len(priorities) != len(set(priorities)):
-            raise ValueError("Provider priorities must be unique")
-
-        # Check for duplicate provider names
-        names = [p.name for p in v]
-        if len(names) != len(set(names)):
-            raise ValueError("Provider names must be unique")
+        # Check for duplicate priorities and names in a single pass
+        seen_priorities = set()
+        seen_names = set()
+        for provider in v:
+            if provider.priority in seen_priorities:
+                raise ValueError("Provider priorities must be unique")
+            seen_priorities.add(provider.priority)
+            if provider.name in seen_names:
+                raise ValueError("Provider names must be unique")
+            seen_names.add(provider.name)
 
         return v
 
     @model_validator(mode="after")
     def sort_providers_by_priority(self) -> "FlexiAIConfig":
         """Sort providers by priority (lower number = higher priority)."""
-        self.providers = sorted(self.providers, key=lambda p: p.priority)
+        self.providers = sorted(self.providers, key=attrgetter("priority"))
         return self
 
     def get_provider_by_name(self, name: str) -> Optional[ProviderConfig]:
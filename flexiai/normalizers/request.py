@@ -89,6 +89,15 @@ class OpenAIRequestNormalizer(RequestNormalizer):
         "user": "user",
     }
 
+    # Model name prefixes accepted by validate_model_support (tuple for str.startswith)
+    SUPPORTED_MODEL_PREFIXES = (
+        "gpt-4",
+        "gpt-3.5",
+        "gpt-4-turbo",
+        "gpt-4o",
+        "o1",
+    )
+
     def normalize(self, request: UnifiedRequest) -> Dict[str, Any]:
         """
         Normalize unified request to OpenAI API format.
@@ -117,9 +126,11 @@ class OpenAIRequestNormalizer(RequestNormalizer):
             "messages": self.normalize_messages(request.messages),
         }
 
-        # Add optional parameters if present
+        # Add optional parameters if present; read the validated field values
+        # straight from the model's __dict__ rather than one getattr per field
+        fields = request.__dict__
         for unified_param, openai_param in self.PARAMETER_MAPPING.items():
-            value = getattr(request, unified_param, None)
+            value = fields.get(unified_param)
             if value is not None:
                 normalized[openai_param] = value
 
@@ -185,14 +196,7 @@ class OpenAIRequestNormalizer(RequestNormalizer):
             This is a basic check. Full validation should be done
             by the ModelValidator in utils/validators.py
         """
-        supported_prefixes = [
-            "gpt-4",
-            "gpt-3.5",
-            "gpt-4-turbo",
-            "gpt-4o",
-            "o1",
-        ]
-        return any(model.startswith(prefix) for prefix in supported_prefixes)
+        return model.startswith(self.SUPPORTED_MODEL_PREFIXES)
 
 
 class GeminiRequestNormalizer(RequestNormalizer):
@@ -226,6 +230,15 @@ class GeminiRequestNormalizer(RequestNormalizer):
         "function": "function",  # Function results
     }
 
+    # Model name prefixes accepted by validate_model_support (tuple for str.startswith)
+    SUPPORTED_MODEL_PREFIXES = (
+        "gemini-2.5",
+        "gemini-2.0",
+        "gemini-1.5",
+        "gemini-pro",
+        "gemini-ultra",
+    )
+
     def normalize(self, request: UnifiedRequest) -> Dict[str, Any]:
         """
         Normalize unified request to Gemini API format.
@@ -346,14 +359,7 @@ class GeminiRequestNormalizer(RequestNormalizer):
             This is a basic check. Full validation should be done
             by the ModelValidator in utils/validators.py
         """
-        supported_prefixes = [
-            "gemini-2.5",
-            "gemini-2.0",
-            "gemini-1.5",
-            "gemini-pro",
-            "gemini-ultra",
-        ]
-        return any(model.startswith(prefix) for prefix in supported_prefixes)
+        return model.startswith(self.SUPPORTED_MODEL_PREFIXES)
 
 
 class ClaudeRequestNormalizer(RequestNormalizer):
@@ -376,6 +382,15 @@ class ClaudeRequestNormalizer(RequestNormalizer):
         "stop": "stop_sequences",  # Claude uses stop_sequences
     }
 
+    # Model name prefixes accepted by validate_model_support (tuple for str.startswith)
+    SUPPORTED_MODEL_PREFIXES = (
+        "claude-3-opus",
+        "claude-3-sonnet",
+        "claude-3-haiku",
+        "claude-3-5-sonnet",
+        "claude-3-5-haiku",
+    )
+
     def normalize(self, request: UnifiedRequest) -> Dict[str, Any]:
         """
         Normalize unified request to Claude Messages API format.
@@ -504,11 +519,4 @@ class ClaudeRequestNormalizer(RequestNormalizer):
             This is a basic check. Full validation should be done
             by the ModelValidator in utils/validators.py
         """
-        supported_models = [
-            "claude-3-opus",
-            "claude-3-sonnet",
-            "claude-3-haiku",
-            "claude-3-5-sonnet",
-            "claude-3-5-haiku",
-        ]
-        return any(model.startswith(prefix) for prefix in supported_models)
+        return model.startswith(self.SUPPORTED_MODEL_PREFIXES)
@@ -75,6 +75,9 @@ class OpenAIResponseNormalizer(ResponseNormalizer):
     Converts OpenAI API responses to UnifiedResponse format.
     """
 
+    # Top-level response fields copied into UnifiedResponse.metadata
+    METADATA_KEYS = ("id", "created", "system_fingerprint", "object")
+
     def normalize(
         self, response: Dict[str, Any], provider_name: str = "openai", model: str = ""
     ) -> UnifiedResponse:
@@ -105,11 +108,12 @@ class OpenAIResponseNormalizer(ResponseNormalizer):
         self._validate_response(response)
 
         # Validate required fields
-        if "choices" not in response or not response["choices"]:
+        choices = response.get("choices")
+        if not choices:
             raise InvalidResponseError("Response must contain at least one choice")
 
         # Extract first choice (main response)
-        choice = response["choices"][0]
+        choice = choices[0]
 
         # Extract content
         content = self._extract_content(choice)
@@ -126,17 +130,11 @@ class OpenAIResponseNormalizer(ResponseNormalizer):
         # Extract finish reason
         finish_reason = choice.get("finish_reason") or "unknown"
 
-        # Extract metadata
+        # Extract metadata, skipping None values
         metadata = {
-            "id": response.get("id"),
-            "created": response.get("created"),
-            "system_fingerprint": response.get("system_fingerprint"),
-            "object": response.get("object"),
+            key: value for key in self.METADATA_KEYS if (value := response.get(key)) is not None
         }
 
-        # Remove None values from metadata
-        metadata = {k: v for k, v in metadata.items() if v is not None}
-
         return UnifiedResponse(
             content=content,
             model=response_model,
@@ -6,7 +6,7 @@ with priority-based selection and circuit breaker integration.
 """
 
 import threading
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
 
 from flexiai.circuit_breaker import CircuitBreaker
 from flexiai.exceptions import ProviderNotFoundError, ProviderRegistrationError
@@ -28,6 +28,10 @@ class ProviderRegistry:
 
     The registry is thread-safe and implements the singleton pattern
     to ensure only one instance exists throughout the application.
+    Mutations and multi-structure reads hold ``_registry_lock``; single
+    dict lookups (``get_provider``, ``get_circuit_breaker``, ``in``,
+    ``len``) are atomic under the GIL and skip the lock, so they may
+    observe the registry as it was just before a concurrent write.
 
     Attributes:
         _instance: Singleton instance
@@ -63,6 +67,9 @@ class ProviderRegistry:
         self._providers: Dict[str, BaseProvider] = {}
         self._circuit_breakers: Dict[str, CircuitBreaker] = {}
         self._provider_metadata: Dict[str, Dict] = {}
+        # (priority, name) pairs ordered by priority. Selection only re-sorts
+        # when a provider's config.priority no longer matches the cached value.
+        self._priority_order: List[Tuple[int, str]] = []
         self._registry_lock = threading.Lock()
         self.logger = FlexiAILogger.get_logger("flexiai.providers.registry")
         self._initialized = True
@@ -87,34 +94,71 @@ class ProviderRegistry:
             ProviderRegistrationError: If provider is invalid or already registered
             TypeError: If provider doesn't implement BaseProvider
         """
-        if not isinstance(provider, BaseProvider):
-            raise TypeError(f"Provider must be an instance of BaseProvider, got {type(provider)}")
+        self.register_many([provider], circuit_breaker_config, sync_manager)
+
+    def register_many(
+        self,
+        providers: Iterable[BaseProvider],
+        circuit_breaker_config: Optional[CircuitBreakerConfig] = None,
+        sync_manager: Optional["StateSyncManager"] = None,
+    ) -> None:
+        """
+        Register several providers under a single lock acquisition.
+
+        All providers are validated before any is registered, so a rejected
+        batch leaves the registry unchanged. Priority order is rebuilt once
+        for the whole batch.
+
+        Args:
+            providers: Provider instances to register
+            circuit_breaker_config: Optional circuit breaker configuration for every provider
+            sync_manager: Optional sync manager for multi-worker synchronization
+
+        Raises:
+            ProviderRegistrationError: If a provider is already registered or
+                appears more than once in the batch
+            TypeError: If a provider doesn't implement BaseProvider
+        """
+        providers = list(providers)
+        for provider in providers:
+            if not isinstance(provider, BaseProvider):
+                raise TypeError(
+                    f"Provider must be an instance of BaseProvider, got {type(provider)}"
+                )
 
         with self._registry_lock:
-            if provider.name in self._providers:
-                raise ProviderRegistrationError(f"Provider '{provider.name}' is already registered")
+            names = set()
+            for provider in providers:
+                if provider.name in self._providers or provider.name in names:
+                    raise ProviderRegistrationError(
+                        f"Provider '{provider.name}' is already registered"
+                    )
+                names.add(provider.name)
 
-            # Create circuit breaker for this provider
+            # Create circuit breaker for each provider
             if circuit_breaker_config is None:
                 circuit_breaker_config = CircuitBreakerConfig()
 
-            circuit_breaker = CircuitBreaker(
-                name=provider.name, config=circuit_breaker_config, sync_manager=sync_manager
-            )
-
-            self._providers[provider.name] = provider
-            self._circuit_breakers[provider.name] = circuit_breaker
-            self._provider_metadata[provider.name] = {
-                "name": provider.name,
-                "model": provider.config.model,
-                "priority": provider.config.priority,
-                "status": "registered",
-            }
+            for provider in providers:
+                circuit_breaker = CircuitBreaker(
+                    name=provider.name, config=circuit_breaker_config, sync_manager=sync_manager
+                )
+
+                self._providers[provider.name] = provider
+                self._circuit_breakers[provider.name] = circuit_breaker
+                self._provider_metadata[provider.name] = {
+                    "name": provider.name,
+                    "model": provider.config.model,
+                    "priority": provider.config.priority,
+                    "status": "registered",
+                }
+
+                self.logger.info(
+                    f"Registered provider '{provider.name}' with model '{provider.config.model}' "
+                    f"(priority: {provider.config.priority})"
+                )
 
-            self.logger.info(
-                f"Registered provider '{provider.name}' with model '{provider.config.model}' "
-                f"(priority: {provider.config.priority})"
-            )
+            self._update_priority_order()
 
     def unregister(self, provider_name: str) -> None:
         """
@@ -127,12 +171,12 @@ class ProviderRegistry:
             ProviderNotFoundError: If provider is not registered
         """
         with self._registry_lock:
-            if provider_name not in self._providers:
+            if self._providers.pop(provider_name, None) is None:
                 raise ProviderNotFoundError(f"Provider '{provider_name}' is not registered")
 
-            del self._providers[provider_name]
             del self._circuit_breakers[provider_name]
             del self._provider_metadata[provider_name]
+            self._update_priority_order()
 
             self.logger.info(f"Unregistered provider '{provider_name}'")
 
@@ -149,10 +193,10 @@ class ProviderRegistry:
         Raises:
             ProviderNotFoundError: If provider is not registered
         """
-        with self._registry_lock:
-            if provider_name not in self._providers:
-                raise ProviderNotFoundError(f"Provider '{provider_name}' is not registered")
-            return self._providers[provider_name]
+        provider = self._providers.get(provider_name)
+        if provider is None:
+            raise ProviderNotFoundError(f"Provider '{provider_name}' is not registered")
+        return provider
 
     def get_circuit_breaker(self, provider_name: str) -> CircuitBreaker:
         """
@@ -167,10 +211,10 @@ class ProviderRegistry:
         Raises:
             ProviderNotFoundError: If provider is not registered
         """
-        with self._registry_lock:
-            if provider_name not in self._circuit_breakers:
-                raise ProviderNotFoundError(f"Provider '{provider_name}' is not registered")
-            return self._circuit_breakers[provider_name]
+        circuit_breaker = self._circuit_breakers.get(provider_name)
+        if circuit_breaker is None:
+            raise ProviderNotFoundError(f"Provider '{provider_name}' is not registered")
+        return circuit_breaker
 
     def list_providers(self, include_metadata: bool = False) -> List[str]:
         """
@@ -196,19 +240,21 @@ class ProviderRegistry:
 
         Returns:
             List of providers sorted by priority (highest first)
+
+        Note:
+            Changes to a registered provider's ``config.priority`` are picked up
+            on the next call; no explicit refresh is needed.
         """
         with self._registry_lock:
             providers = []
-            for name, provider in self._providers.items():
+            for name in self._ordered_names():
                 if only_available:
-                    circuit_breaker = self._circuit_breakers[name]
-                    if circuit_breaker.is_open():
+                    if self._circuit_breakers[name].is_open_fast():
                         self.logger.debug(f"Skipping provider '{name}' - circuit breaker is OPEN")
                         continue
-                providers.append(provider)
+                providers.append(self._providers[name])
 
-            # Sort by priority (lower number = higher priority)
-            return sorted(providers, key=lambda p: p.config.priority)
+            return providers
 
     def get_next_available_provider(
         self, exclude: Optional[List[str]] = None
@@ -222,17 +268,16 @@ class ProviderRegistry:
         Returns:
             The next available provider, or None if no providers available
         """
-        exclude = exclude or []
+        # Set membership keeps the per-provider exclusion check O(1)
+        excluded = frozenset(exclude) if exclude else frozenset()
 
         with self._registry_lock:
-            for name, provider in sorted(
-                self._providers.items(), key=lambda x: x[1].config.priority
-            ):
-                if name in exclude:
+            for name in self._ordered_names():
+                if name in excluded:
                     continue
 
-                circuit_breaker = self._circuit_breakers[name]
-                if not circuit_breaker.is_open():
+                if not self._circuit_breakers[name].is_open_fast():
+                    provider = self._providers[name]
                     self.logger.debug(
                         f"Selected provider '{name}' (priority: {provider.config.priority})"
                     )
@@ -256,10 +301,10 @@ class ProviderRegistry:
             ProviderNotFoundError: If provider is not registered
         """
         with self._registry_lock:
-            if provider_name not in self._providers:
+            circuit_breaker = self._circuit_breakers.get(provider_name)
+            if circuit_breaker is None:
                 raise ProviderNotFoundError(f"Provider '{provider_name}' is not registered")
 
-            circuit_breaker = self._circuit_breakers[provider_name]
             metadata = self._provider_metadata[provider_name]
 
             return {
@@ -300,10 +345,11 @@ class ProviderRegistry:
             ProviderNotFoundError: If provider is not registered
         """
         with self._registry_lock:
-            if provider_name not in self._circuit_breakers:
+            circuit_breaker = self._circuit_breakers.get(provider_name)
+            if circuit_breaker is None:
                 raise ProviderNotFoundError(f"Provider '{provider_name}' is not registered")
 
-            self._circuit_breakers[provider_name].reset()
+            circuit_breaker.reset()
             self.logger.info(f"Reset circuit breaker for provider '{provider_name}'")
 
     def reset_all_circuit_breakers(self) -> None:
@@ -321,17 +367,38 @@ class ProviderRegistry:
             self._providers.clear()
             self._circuit_breakers.clear()
             self._provider_metadata.clear()
+            self._priority_order.clear()
             self.logger.info("Cleared all providers from registry")
 
+    def _update_priority_order(self) -> None:
+        """Re-sort providers by priority (lower number = higher priority)."""
+        self._priority_order = sorted(
+            ((provider.config.priority, name) for name, provider in self._providers.items()),
+            key=lambda entry: entry[0],
+        )
+
+    def _ordered_names(self) -> List[str]:
+        """
+        Return provider names in priority order, re-sorting if priorities changed.
+
+        Priorities can be mutated in place on ``provider.config``; comparing the
+        cached values is O(n) and avoids sorting on every selection. Must be
+        called with ``_registry_lock`` held.
+        """
+        providers = self._providers
+        if any(
+            providers[name].config.priority != priority for priority, name in self._priority_order
+        ):
+            self._update_priority_order()
+        return [name for _, name in self._priority_order]
+
     def __len__(self) -> int:
         """Return the number of registered providers."""
-        with self._registry_lock:
-            return len(self._providers)
+        return len(self._providers)
 
     def __contains__(self, provider_name: str) -> bool:
         """Check if a provider is registered."""
-        with self._registry_lock:
-            return provider_name in self._providers
+        return provider_name in self._providers
 
     def __repr__(self) -> str:
         """Return string representation of the registry."""
@@ -9,17 +9,150 @@ This module provides structured logging with:
 - Debug mode for request/response logging
 """
 
+import atexit
+import functools
 import logging
+import os
+import queue
 import re
-import uuid
 from contextlib import contextmanager
 from contextvars import ContextVar
-from logging.handlers import RotatingFileHandler
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Any, Dict, Generator, Optional
+from typing import Any, Callable, Dict, Generator, List, Optional, Pattern, Tuple
+
+try:
+    import re2
+
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+    re2 = None
+
+# Placeholder logged when no correlation ID is set
+_NO_CORRELATION_ID = "N/A"
 
 # Context variable for correlation ID
-correlation_id: ContextVar[Optional[str]] = ContextVar("correlation_id", default=None)
+correlation_id: ContextVar[str] = ContextVar("correlation_id", default=_NO_CORRELATION_ID)
+
+
+def _new_correlation_id() -> str:
+    """Generate a random 16-character hex correlation ID."""
+    return os.urandom(8).hex()
+
+
+# Patterns for sensitive data, compiled once at import time
+_SENSITIVE_PATTERNS: Tuple[Tuple[Pattern[str], str], ...] = (
+    # API keys (sk-..., key-..., etc.)
+    (re.compile(r"sk-[a-zA-Z0-9]{8,}", re.IGNORECASE), "***MASKED***"),
+    (re.compile(r"key-[a-zA-Z0-9]{8,}", re.IGNORECASE), "***MASKED***"),
+    # Bearer tokens
+    (re.compile(r"Bearer\s+[a-zA-Z0-9\-._~+/]+=*", re.IGNORECASE), "***MASKED***"),
+    # Generic tokens
+    (
+        re.compile(r"(token[\"']?\s*[:=]\s*[\"']?)([a-zA-Z0-9\-._~+/]{8,})", re.IGNORECASE),
+        r"\1***MASKED***",
+    ),
+    # API key fields in JSON/dict
+    (
+        re.compile(r"(['\"]api_key['\"]:\s*['\"])([^'\"]+)(['\"])", re.IGNORECASE),
+        r"\1***MASKED***\3",
+    ),
+    # Authorization headers
+    (
+        re.compile(r"(Authorization[\"']?\s*[:=]\s*[\"']?)([^\"'\s]+)", re.IGNORECASE),
+        r"\1***MASKED***",
+    ),
+)
+
+# Bytes builds of the patterns for binary payloads (e.g. raw HTTP bodies), so
+# they are masked without a decode/encode round trip
+_SENSITIVE_PATTERNS_BYTES: Tuple[Tuple[Pattern[bytes], bytes], ...] = tuple(
+    (re.compile(pattern.pattern.encode(), pattern.flags & ~re.UNICODE), replacement.encode())
+    for pattern, replacement in _SENSITIVE_PATTERNS
+)
+
+# Lowercase substrings at least one of which every pattern match contains; a
+# message without any of them cannot match, so masking skips the regex scan.
+# "author"/"key" avoid the letter "i", whose IGNORECASE matches ("İ", "ı")
+# casefold() does not map back to "i"
+_SENSITIVE_TRIGGERS = ("sk-", "key", "bearer", "token", "author")
+_SENSITIVE_TRIGGERS_BYTES = tuple(trigger.encode() for trigger in _SENSITIVE_TRIGGERS)
+
+# All patterns fused into one alternation: a single scan tells whether a message
+# holds anything to mask, so clean messages skip the per-pattern substitutions
+_SENSITIVE_ANY: Pattern[str] = re.compile(
+    "|".join(f"(?:{pattern.pattern})" for pattern, _ in _SENSITIVE_PATTERNS), re.IGNORECASE
+)
+
+
+def _re2_ascii_pattern(pattern: str) -> str:
+    """
+    Translate a ``re`` pattern for RE2 so it matches at least the same ASCII text.
+
+    RE2's ``\\s`` omits ``\\v`` and ``\\x1c``-``\\x1f``, which Python's ``\\s``
+    includes, so each ``\\s`` outside a character class is widened. Inside a
+    (negated) class RE2's narrower ``\\s`` only makes the class broader. A
+    ``]`` right after ``[`` or ``[^`` is a literal member, not the class end.
+
+    Args:
+        pattern: ``re`` pattern source
+
+    Returns:
+        RE2 pattern source
+    """
+    translated = []
+    in_class = False
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == "\\":
+            escape = pattern[index : index + 2]
+            if escape == r"\s" and not in_class:
+                escape = r"[\s\x0b\x1c-\x1f]"
+            translated.append(escape)
+            index += 2
+            continue
+        if char == "[" and not in_class:
+            in_class = True
+            # Copy the opening bracket, an optional "^" and a leading literal "]"
+            end = index + 1
+            if pattern.startswith("^", end):
+                end += 1
+            if pattern.startswith("]", end):
+                end += 1
+            translated.append(pattern[index:end])
+            index = end
+            continue
+        if char == "]":
+            in_class = False
+        translated.append(char)
+        index += 1
+    return "".join(translated)
+
+
+# Optional google-re2 build of the pre-scan (linear time, no backtracking). Only
+# used for ASCII text, where its case folding agrees with ``re``; masking
+# substitutions always use ``re``
+_SENSITIVE_ANY_RE2 = (
+    re2.compile("(?i)" + _re2_ascii_pattern(_SENSITIVE_ANY.pattern)) if RE2_AVAILABLE else None
+)
+
+# Dictionary keys whose values are always masked (compared after lowercasing
+# and stripping "_" and "-")
+_SENSITIVE_KEYS = frozenset(
+    {
+        "api_key",
+        "apikey",
+        "api-key",
+        "token",
+        "access_token",
+        "secret",
+        "password",
+        "authorization",
+        "auth",
+    }
+)
 
 
 class SensitiveDataFilter(logging.Filter):
@@ -29,29 +162,8 @@ class SensitiveDataFilter(logging.Filter):
     Masks API keys, tokens, and other sensitive information before logging.
     """
 
-    # Patterns for sensitive data
-    PATTERNS = [
-        # API keys (sk-..., key-..., etc.)
-        (re.compile(r"sk-[a-zA-Z0-9]{8,}", re.IGNORECASE), "***MASKED***"),
-        (re.compile(r"key-[a-zA-Z0-9]{8,}", re.IGNORECASE), "***MASKED***"),
-        # Bearer tokens
-        (re.compile(r"Bearer\s+[a-zA-Z0-9\-._~+/]+=*", re.IGNORECASE), "***MASKED***"),
-        # Generic tokens
-        (
-            re.compile(r"(token[\"']?\s*[:=]\s*[\"']?)([a-zA-Z0-9\-._~+/]{8,})", re.IGNORECASE),
-            r"\1***MASKED***",
-        ),
-        # API key fields in JSON/dict
-        (
-            re.compile(r"(['\"]api_key['\"]:\s*['\"])([^'\"]+)(['\"])", re.IGNORECASE),
-            r"\1***MASKED***\3",
-        ),
-        # Authorization headers
-        (
-            re.compile(r"(Authorization[\"']?\s*[:=]\s*[\"']?)([^\"'\s]+)", re.IGNORECASE),
-            r"\1***MASKED***",
-        ),
-    ]
+    # Patterns for sensitive data (shared, precompiled module-level tuple)
+    PATTERNS = _SENSITIVE_PATTERNS
 
     def filter(self, record: logging.LogRecord) -> bool:
         """
@@ -63,7 +175,10 @@ class SensitiveDataFilter(logging.Filter):
         Returns:
             True (always allows the record through after masking)
         """
-        record.msg = self._mask_sensitive_data(str(record.msg))
+        if isinstance(record.msg, (bytes, bytearray)):
+            record.msg = self._mask_sensitive_bytes(bytes(record.msg))
+        else:
+            record.msg = self._mask_sensitive_data(str(record.msg))
         if record.args:
             record.args = tuple(
                 self._mask_sensitive_data(str(arg)) if isinstance(arg, str) else arg
@@ -81,10 +196,44 @@ class SensitiveDataFilter(logging.Filter):
         Returns:
             Text with sensitive data masked
         """
+        folded = text.casefold()
+        if not any(trigger in folded for trigger in _SENSITIVE_TRIGGERS):
+            return text
+        if _SENSITIVE_ANY_RE2 is not None and text.isascii():
+            found = _SENSITIVE_ANY_RE2.search(text)
+        else:
+            found = _SENSITIVE_ANY.search(text)
+        if not found:
+            return text
+        # Substitute pattern by pattern: matches can overlap (e.g. a Bearer
+        # token inside an Authorization header), so one fused sub() would
+        # leave parts of a secret unmasked
         for pattern, replacement in self.PATTERNS:
             text = pattern.sub(replacement, text)
         return text
 
+    def _mask_sensitive_bytes(self, data: bytes) -> bytes:
+        """
+        Mask sensitive data in a binary payload.
+
+        Args:
+            data: Bytes to mask
+
+        Returns:
+            Bytes with sensitive data masked
+        """
+        lowered = data.lower()
+        if not any(trigger in lowered for trigger in _SENSITIVE_TRIGGERS_BYTES):
+            return data
+        for pattern, replacement in _SENSITIVE_PATTERNS_BYTES:
+            data = pattern.sub(replacement, data)
+        return data
+
+
+# The filter holds no per-record state, so every handler and
+# mask_sensitive_data() share this one instance
+_SENSITIVE_FILTER = SensitiveDataFilter()
+
 
 class CorrelationIdFilter(logging.Filter):
     """
@@ -103,16 +252,37 @@ class CorrelationIdFilter(logging.Filter):
         Returns:
             True (always allows the record through)
         """
-        record.correlation_id = correlation_id.get() or "N/A"
+        record.correlation_id = correlation_id.get()
         return True
 
 
+def _buffer_capacity_from_env() -> int:
+    """
+    Read the file-log buffer capacity from the FLEXIAI_LOG_BUF env var.
+
+    Returns:
+        Buffer capacity (default: 1000)
+
+    Raises:
+        ValueError: If FLEXIAI_LOG_BUF is not a non-negative integer
+    """
+    raw = os.getenv("FLEXIAI_LOG_BUF", "1000")
+    try:
+        capacity = int(raw)
+    except ValueError:
+        capacity = -1
+    if capacity < 0:
+        raise ValueError(f"FLEXIAI_LOG_BUF must be a non-negative integer, got {raw!r}")
+    return capacity
+
+
 class FlexiAILogger:
     """
     Custom logger for FlexiAI with structured logging and sensitive data masking.
 
     Features:
-    - Rotating file handler for persistent logs
+    - Rotating file handler for persistent logs, buffered and written on a
+      background thread
     - Console handler for warnings and errors
     - Automatic sensitive data masking
     - Correlation ID support for request tracing
@@ -125,8 +295,10 @@ class FlexiAILogger:
         ...     logger.info("Request started")
     """
 
-    _loggers: Dict[str, logging.Logger] = {}
     _configured = False
+    _listener: Optional[QueueListener] = None
+    # Type -> masking handler for mask_sensitive_data, filled in after the class
+    _MASK_DISPATCH: Dict[type, Callable[[Any], Any]] = {}
 
     @classmethod
     def setup_logging(
@@ -136,6 +308,7 @@ class FlexiAILogger:
         max_bytes: int = 10 * 1024 * 1024,  # 10 MB
         backup_count: int = 5,
         format_string: Optional[str] = None,
+        buffer_capacity: Optional[int] = None,
     ) -> None:
         """
         Set up logging configuration for FlexiAI.
@@ -146,6 +319,13 @@ class FlexiAILogger:
             max_bytes: Maximum size of log file before rotation
             backup_count: Number of backup files to keep
             format_string: Custom log format string
+            buffer_capacity: Number of records buffered before the log file is
+                written (or FLEXIAI_LOG_BUF env var, default: 1000). ERROR and
+                above flush immediately; 0 writes every record.
+
+        Raises:
+            ValueError: If FLEXIAI_LOG_BUF is set to anything but a non-negative
+                integer (only read when logging to a file)
 
         Example:
             >>> FlexiAILogger.setup_logging(
@@ -157,6 +337,14 @@ class FlexiAILogger:
         if cls._configured:
             return
 
+        # Resolve the buffer size before any handler is touched, so a bad
+        # environment value cannot leave logging half-configured
+        if log_file and buffer_capacity is None:
+            buffer_capacity = _buffer_capacity_from_env()
+
+        # Drain and close the file listener of any previous configuration
+        cls.shutdown()
+
         # Default format with correlation ID
         if format_string is None:
             format_string = (
@@ -170,11 +358,12 @@ class FlexiAILogger:
         logger.setLevel(getattr(logging, level.upper()))
         logger.handlers.clear()
 
-        # Console handler (WARNING and above)
+        # Console handler (WARNING and above). Filters are attached to handlers,
+        # not the logger, so masking only runs for records a handler accepts.
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.WARNING)
         console_handler.setFormatter(formatter)
-        console_handler.addFilter(SensitiveDataFilter())
+        console_handler.addFilter(_SENSITIVE_FILTER)
         console_handler.addFilter(CorrelationIdFilter())
         logger.addHandler(console_handler)
 
@@ -188,14 +377,52 @@ class FlexiAILogger:
                 maxBytes=max_bytes,
                 backupCount=backup_count,
             )
-            file_handler.setLevel(getattr(logging, level.upper()))
             file_handler.setFormatter(formatter)
-            file_handler.addFilter(SensitiveDataFilter())
-            file_handler.addFilter(CorrelationIdFilter())
-            logger.addHandler(file_handler)
+
+            # Disk writes run on a background listener thread so callers only pay
+            # for a queue put. Masking and the correlation ID (a context variable)
+            # must be resolved on the caller's thread, so the filters sit on the
+            # queue handler rather than on the file handler.
+            log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+            queue_handler = QueueHandler(log_queue)
+            queue_handler.setLevel(getattr(logging, level.upper()))
+            queue_handler.addFilter(_SENSITIVE_FILTER)
+            queue_handler.addFilter(CorrelationIdFilter())
+            logger.addHandler(queue_handler)
+
+            # Batch file writes; errors flush the buffer straight away
+            buffered_handler = MemoryHandler(
+                buffer_capacity, flushLevel=logging.ERROR, target=file_handler
+            )
+
+            cls._listener = QueueListener(log_queue, buffered_handler)
+            cls._listener.start()
 
         cls._configured = True
 
+    @classmethod
+    def shutdown(cls) -> None:
+        """
+        Stop the background file-logging listener.
+
+        Records still queued or buffered are written out before the file
+        handler is closed.
+        Called automatically at interpreter exit.
+
+        Example:
+            >>> FlexiAILogger.shutdown()
+        """
+        listener, cls._listener = cls._listener, None
+        if listener is None:
+            return
+        listener.stop()
+        for handler in listener.handlers:
+            # MemoryHandler.close() flushes but leaves its target open
+            target = getattr(handler, "target", None)
+            handler.close()
+            if target is not None:
+                target.close()
+
     @classmethod
     def get_logger(cls, name: str = "flexiai") -> logging.Logger:
         """
@@ -214,10 +441,24 @@ class FlexiAILogger:
         if not cls._configured:
             cls.setup_logging()
 
-        if name not in cls._loggers:
-            cls._loggers[name] = logging.getLogger(name)
+        return cls._get_cached_logger(name)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_cached_logger(name: str) -> logging.Logger:
+        """
+        Look up a logger by name.
+
+        Cached so repeated lookups skip the logging module lock taken by
+        ``logging.getLogger``.
 
-        return cls._loggers[name]
+        Args:
+            name: Logger name
+
+        Returns:
+            Logger instance
+        """
+        return logging.getLogger(name)
 
     @classmethod
     def set_correlation_id(cls, corr_id: Optional[str] = None) -> str:
@@ -225,7 +466,7 @@ class FlexiAILogger:
         Set correlation ID for request tracing.
 
         Args:
-            corr_id: Correlation ID (generates UUID if None)
+            corr_id: Correlation ID (generates a random ID if None)
 
         Returns:
             The correlation ID that was set
@@ -235,7 +476,7 @@ class FlexiAILogger:
             >>> logger.info("Request processing")  # Will include correlation ID
         """
         if corr_id is None:
-            corr_id = str(uuid.uuid4())
+            corr_id = _new_correlation_id()
         correlation_id.set(corr_id)
         return corr_id
 
@@ -247,7 +488,7 @@ class FlexiAILogger:
         Example:
             >>> FlexiAILogger.clear_correlation_id()
         """
-        correlation_id.set(None)
+        correlation_id.set(_NO_CORRELATION_ID)
 
     @classmethod
     @contextmanager
@@ -256,7 +497,7 @@ class FlexiAILogger:
         Context manager for correlation ID.
 
         Args:
-            corr_id: Correlation ID (generates UUID if None)
+            corr_id: Correlation ID (generates a random ID if None)
 
         Yields:
             The correlation ID
@@ -266,9 +507,10 @@ class FlexiAILogger:
             ...     logger.info("Processing request")
             ...     # All logs in this block will have the same correlation ID
         """
-        token = correlation_id.set(corr_id or str(uuid.uuid4()))
+        corr_id = corr_id or _new_correlation_id()
+        token = correlation_id.set(corr_id)
         try:
-            yield correlation_id.get()
+            yield corr_id
         finally:
             correlation_id.reset(token)
 
@@ -281,7 +523,9 @@ class FlexiAILogger:
             data: Data to mask (dict, str, list, etc.)
 
         Returns:
-            Data with sensitive information masked
+            Data with sensitive information masked. Dicts and lists are copied
+            only if something inside them is masked; otherwise the original
+            object is returned, so callers must not mutate the result.
 
         Example:
             >>> masked = FlexiAILogger.mask_sensitive_data({
@@ -291,44 +535,78 @@ class FlexiAILogger:
             >>> print(masked)
             {'api_key': '***MASKED***', 'model': 'gpt-4'}
         """
-        if isinstance(data, dict):
-            return {
-                key: (
-                    "***MASKED***" if cls._is_sensitive_key(key) else cls.mask_sensitive_data(value)
-                )
-                for key, value in data.items()
-            }
-        elif isinstance(data, list):
-            return [cls.mask_sensitive_data(item) for item in data]
-        elif isinstance(data, str):
-            filter_instance = SensitiveDataFilter()
-            return filter_instance._mask_sensitive_data(data)
-        else:
-            return data
+        handler = cls._MASK_DISPATCH.get(type(data))
+        if handler is not None:
+            return handler(data)
+        # Subclasses (OrderedDict, str enums, ...) miss the exact-type lookup
+        for base, handler in cls._MASK_DISPATCH.items():
+            if isinstance(data, base):
+                return handler(data)
+        return data
+
+    @classmethod
+    def _mask_dict(cls, data: Dict[Any, Any]) -> Dict[Any, Any]:
+        """Mask sensitive keys and values in a dictionary (copy-on-write)."""
+        masked_dict: Optional[Dict[Any, Any]] = None
+        for key, value in data.items():
+            new_value = (
+                "***MASKED***" if cls._is_sensitive_key(key) else cls.mask_sensitive_data(value)
+            )
+            if masked_dict is None:
+                if new_value is value:
+                    continue
+                # First change: copy, then overwrite from here on
+                masked_dict = dict(data)
+            masked_dict[key] = new_value
+        return data if masked_dict is None else masked_dict
 
     @classmethod
-    def _is_sensitive_key(cls, key: str) -> bool:
+    def _mask_list(cls, data: List[Any]) -> List[Any]:
+        """Mask sensitive data in list items (copy-on-write)."""
+        masked_list: Optional[List[Any]] = None
+        for index, item in enumerate(data):
+            new_item = cls.mask_sensitive_data(item)
+            if masked_list is None:
+                if new_item is item:
+                    continue
+                masked_list = list(data)
+            masked_list[index] = new_item
+        return data if masked_list is None else masked_list
+
+    @classmethod
+    def _mask_str(cls, data: str) -> str:
+        """Mask sensitive data in a string."""
+        return _SENSITIVE_FILTER._mask_sensitive_data(data)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _is_sensitive_key(key: str) -> bool:
         """
         Check if a dictionary key contains sensitive data.
 
+        Results are cached: payload keys repeat across log records and come
+        from a small set of names.
+
         Args:
             key: Dictionary key
 
         Returns:
             True if the key is sensitive
         """
-        sensitive_keys = {
-            "api_key",
-            "apikey",
-            "api-key",
-            "token",
-            "access_token",
-            "secret",
-            "password",
-            "authorization",
-            "auth",
-        }
-        return key.lower().replace("_", "").replace("-", "") in sensitive_keys
+        # Plain lowercase ASCII keys ("model", "content", ...) are already
+        # normalized, so skip building the three intermediate strings
+        if key.isascii() and key.isalpha() and key.islower():
+            return key in _SENSITIVE_KEYS
+        return key.lower().replace("_", "").replace("-", "") in _SENSITIVE_KEYS
+
+
+FlexiAILogger._MASK_DISPATCH = {
+    dict: FlexiAILogger._mask_dict,
+    list: FlexiAILogger._mask_list,
+    str: FlexiAILogger._mask_str,
+}
+
+atexit.register(FlexiAILogger.shutdown)
 
 
 # Convenience function to get the default logger
@@ -146,6 +146,11 @@ class ModelValidator:
         ],
     }
 
+    # Frozen copies of SUPPORTED_MODELS for O(1) membership checks in validate
+    _SUPPORTED_MODEL_SETS = {
+        provider: frozenset(models) for provider, models in SUPPORTED_MODELS.items()
+    }
+
     @classmethod
     def validate(cls, provider: str, model: str, strict: bool = False) -> bool:
         """
@@ -175,7 +180,7 @@ class ModelValidator:
             )
 
         provider_lower = provider.lower()
-        supported = cls.SUPPORTED_MODELS.get(provider_lower, [])
+        supported = cls._SUPPORTED_MODEL_SETS.get(provider_lower, frozenset())
 
         # Azure allows any model (deployment name)
         if "*" in supported:
@@ -189,7 +194,7 @@ class ModelValidator:
                     details={
                         "provider": provider,
                         "model": model,
-                        "supported_models": supported,
+                        "supported_models": cls.SUPPORTED_MODELS.get(provider_lower, []),
                     },
                 )
             # In non-strict mode, allow unknown models (they might be newer)
@@ -223,6 +228,45 @@ class RequestValidator:
     Validates common request parameters like temperature, max_tokens, etc.
     """
 
+    # Inclusive bounds for range-checked parameters: name -> (label, min, max)
+    PARAMETER_RANGES = {
+        "temperature": ("Temperature", 0.0, 2.0),
+        "top_p": ("top_p", 0.0, 1.0),
+        "frequency_penalty": ("frequency_penalty", -2.0, 2.0),
+        "presence_penalty": ("presence_penalty", -2.0, 2.0),
+    }
+
+    @classmethod
+    def _validate_range(cls, name: str, value: float) -> bool:
+        """
+        Validate a numeric parameter against its PARAMETER_RANGES bounds.
+
+        Args:
+            name: Parameter name (key in PARAMETER_RANGES)
+            value: Parameter value
+
+        Returns:
+            True if valid
+
+        Raises:
+            ValidationError: If value is not a number or is out of range
+        """
+        label, low, high = cls.PARAMETER_RANGES[name]
+
+        if not isinstance(value, (int, float)):
+            raise ValidationError(
+                f"{label} must be a number",
+                details={name: value, "type": type(value).__name__},
+            )
+
+        if not low <= value <= high:
+            raise ValidationError(
+                f"{label} must be between {low} and {high}",
+                details={name: value},
+            )
+
+        return True
+
     @classmethod
     def validate_temperature(cls, temperature: float) -> bool:
         """
@@ -241,19 +285,7 @@ class RequestValidator:
             >>> RequestValidator.validate_temperature(0.7)
             True
         """
-        if not isinstance(temperature, (int, float)):
-            raise ValidationError(
-                "Temperature must be a number",
-                details={"temperature": temperature, "type": type(temperature).__name__},
-            )
-
-        if not 0.0 <= temperature <= 2.0:
-            raise ValidationError(
-                "Temperature must be between 0.0 and 2.0",
-                details={"temperature": temperature},
-            )
-
-        return True
+        return cls._validate_range("temperature", temperature)
 
     @classmethod
     def validate_max_tokens(cls, max_tokens: int, provider: str = "openai") -> bool:
@@ -320,19 +352,7 @@ class RequestValidator:
             >>> RequestValidator.validate_top_p(0.9)
             True
         """
-        if not isinstance(top_p, (int, float)):
-            raise ValidationError(
-                "top_p must be a number",
-                details={"top_p": top_p, "type": type(top_p).__name__},
-            )
-
-        if not 0.0 <= top_p <= 1.0:
-            raise ValidationError(
-                "top_p must be between 0.0 and 1.0",
-                details={"top_p": top_p},
-            )
-
-        return True
+        return cls._validate_range("top_p", top_p)
 
     @classmethod
     def validate_frequency_penalty(cls, frequency_penalty: float) -> bool:
@@ -352,22 +372,7 @@ class RequestValidator:
             >>> RequestValidator.validate_frequency_penalty(0.5)
             True
         """
-        if not isinstance(frequency_penalty, (int, float)):
-            raise ValidationError(
-                "frequency_penalty must be a number",
-                details={
-                    "frequency_penalty": frequency_penalty,
-                    "type": type(frequency_penalty).__name__,
-                },
-            )
-
-        if not -2.0 <= frequency_penalty <= 2.0:
-            raise ValidationError(
-                "frequency_penalty must be between -2.0 and 2.0",
-                details={"frequency_penalty": frequency_penalty},
-            )
-
-        return True
+        return cls._validate_range("frequency_penalty", frequency_penalty)
 
     @classmethod
     def validate_presence_penalty(cls, presence_penalty: float) -> bool:
@@ -387,22 +392,7 @@ class RequestValidator:
             >>> RequestValidator.validate_presence_penalty(0.5)
             True
         """
-        if not isinstance(presence_penalty, (int, float)):
-            raise ValidationError(
-                "presence_penalty must be a number",
-                details={
-                    "presence_penalty": presence_penalty,
-                    "type": type(presence_penalty).__name__,
-                },
-            )
-
-        if not -2.0 <= presence_penalty <= 2.0:
-            raise ValidationError(
-                "presence_penalty must be between -2.0 and 2.0",
-                details={"presence_penalty": presence_penalty},
-            )
-
-        return True
+        return cls._validate_range("presence_penalty", presence_penalty)
 
     @classmethod
     def validate_messages(cls, messages: List[Dict[str, Any]]) -> bool:
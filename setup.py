@@ -1,5 +1,6 @@
 """Setup configuration for FlexiAI package."""
 
+import os
 from pathlib import Path
 
 from setuptools import find_packages, setup
@@ -12,6 +13,27 @@ long_description = (
     else ""
 )
 
+# Optionally compile hot pure-Python modules with Cython.
+# Opt-in via FLEXIAI_CYTHONIZE=1 so the default distribution stays pure Python.
+# Cython is not a declared build requirement, so an isolated PEP 517 build
+# cannot see it: install Cython first and build with --no-build-isolation.
+ext_modules = []
+if os.environ.get("FLEXIAI_CYTHONIZE") == "1":
+    try:
+        from Cython.Build import cythonize
+    except ImportError as e:
+        raise RuntimeError(
+            "FLEXIAI_CYTHONIZE=1 requires Cython in the build environment. "
+            "Install it with 'pip install cython' and build without isolation, "
+            "e.g. 'pip install --no-build-isolation .' or "
+            "'python -m build --no-isolation'."
+        ) from e
+
+    ext_modules = cythonize(
+        ["flexiai/exceptions.py"],
+        compiler_directives={"language_level": "3"},
+    )
+
 setup(
     name="flexiai",
     version="0.5.0",
@@ -27,6 +49,7 @@ setup(
         "Source Code": "https://github.com/yourusername/flexiai",
     },
     packages=find_packages(exclude=["tests", "tests.*", "examples", "docs"]),
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -56,11 +79,15 @@ setup(
             "pytest-cov>=4.0.0",
             "pytest-asyncio>=0.21.0",
             "pytest-mock>=3.10.0",
+            "pytest-xdist>=3.0.0",
             "black>=23.0.0",
             "flake8>=6.0.0",
             "mypy>=1.0.0",
             "isort>=5.12.0",
         ],
+        "re2": [
+            "google-re2>=1.1",
+        ],
     },
     keywords=[
         "ai",
@@ -440,6 +440,20 @@ class TestCircuitBreakerManualControl:
         assert circuit_breaker.is_closed()
         assert circuit_breaker.state.failure_count == 0
 
+    def test_is_open_fast_tracks_state(self, circuit_breaker):
+        """Test lock-free open check follows state transitions."""
+        assert not circuit_breaker.is_open_fast()
+
+        for _ in range(3):
+            with pytest.raises(ProviderException):
+                circuit_breaker.call(
+                    lambda: exec('raise ProviderException("Test error", provider="test")')
+                )
+        assert circuit_breaker.is_open_fast()
+
+        circuit_breaker.reset()
+        assert not circuit_breaker.is_open_fast()
+
     def test_get_state_info(self, circuit_breaker):
         """Test getting state information."""
         info = circuit_breaker.get_state_info()
@@ -15,9 +15,10 @@ from flexiai.normalizers.request import ClaudeRequestNormalizer
 class TestClaudeRequestNormalizerBasics:
     """Test basic request normalization for Claude."""
 
-    @pytest.fixture
-    def normalizer(self):
-        """Create a Claude request normalizer instance."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def normalizer(cls):
+        """Fixture for Claude request normalizer (stateless, shared across the class)."""
         return ClaudeRequestNormalizer()
 
     def test_basic_request(self, normalizer):
@@ -95,9 +96,10 @@ class TestClaudeRequestNormalizerBasics:
 class TestClaudeMessageNormalization:
     """Test message-specific normalization for Claude."""
 
-    @pytest.fixture
-    def normalizer(self):
-        """Create a Claude request normalizer instance."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def normalizer(cls):
+        """Fixture for Claude request normalizer (stateless, shared across the class)."""
         return ClaudeRequestNormalizer()
 
     def test_alternating_messages(self, normalizer):
@@ -149,9 +151,10 @@ class TestClaudeMessageNormalization:
 class TestClaudeParameterMapping:
     """Test parameter mapping from unified format to Claude format."""
 
-    @pytest.fixture
-    def normalizer(self):
-        """Create a Claude request normalizer instance."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def normalizer(cls):
+        """Fixture for Claude request normalizer (stateless, shared across the class)."""
         return ClaudeRequestNormalizer()
 
     def test_temperature_mapping(self, normalizer):
@@ -201,9 +204,10 @@ class TestClaudeParameterMapping:
 class TestClaudeModelValidation:
     """Test Claude model validation."""
 
-    @pytest.fixture
-    def normalizer(self):
-        """Create a Claude request normalizer instance."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def normalizer(cls):
+        """Fixture for Claude request normalizer (stateless, shared across the class)."""
         return ClaudeRequestNormalizer()
 
     def test_valid_opus_model(self, normalizer):
@@ -235,9 +239,10 @@ class TestClaudeModelValidation:
 class TestClaudeEdgeCases:
     """Test edge cases and special scenarios."""
 
-    @pytest.fixture
-    def normalizer(self):
-        """Create a Claude request normalizer instance."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def normalizer(cls):
+        """Fixture for Claude request normalizer (stateless, shared across the class)."""
         return ClaudeRequestNormalizer()
 
     def test_empty_messages_error(self, normalizer):
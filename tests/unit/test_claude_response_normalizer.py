@@ -13,9 +13,10 @@ from flexiai.normalizers.response import ClaudeResponseNormalizer
 class TestClaudeResponseNormalizerBasics:
     """Test basic response normalization for Claude."""
 
-    @pytest.fixture
-    def normalizer(self):
-        """Create a Claude response normalizer instance."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def normalizer(cls):
+        """Fixture for Claude response normalizer (stateless, shared across the class)."""
         return ClaudeResponseNormalizer()
 
     def test_basic_response(self, normalizer):
@@ -93,9 +94,10 @@ class TestClaudeResponseNormalizerBasics:
 class TestClaudeStopReasonMapping:
     """Test stop reason mapping from Claude to unified format."""
 
-    @pytest.fixture
-    def normalizer(self):
-        """Create a Claude response normalizer instance."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def normalizer(cls):
+        """Fixture for Claude response normalizer (stateless, shared across the class)."""
         return ClaudeResponseNormalizer()
 
     def test_end_turn_maps_to_stop(self, normalizer):
@@ -160,9 +162,10 @@ class TestClaudeStopReasonMapping:
 class TestClaudeUsageExtraction:
     """Test usage information extraction."""
 
-    @pytest.fixture
-    def normalizer(self):
-        """Create a Claude response normalizer instance."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def normalizer(cls):
+        """Fixture for Claude response normalizer (stateless, shared across the class)."""
         return ClaudeResponseNormalizer()
 
     def test_usage_extraction(self, normalizer):
@@ -220,9 +223,10 @@ class TestClaudeUsageExtraction:
 class TestClaudeMetadataExtraction:
     """Test metadata extraction."""
 
-    @pytest.fixture
-    def normalizer(self):
-        """Create a Claude response normalizer instance."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def normalizer(cls):
+        """Fixture for Claude response normalizer (stateless, shared across the class)."""
         return ClaudeResponseNormalizer()
 
     def test_metadata_includes_message_id(self, normalizer):
@@ -263,9 +267,10 @@ class TestClaudeMetadataExtraction:
 class TestClaudeErrorNormalization:
     """Test error response normalization."""
 
-    @pytest.fixture
-    def normalizer(self):
-        """Create a Claude response normalizer instance."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def normalizer(cls):
+        """Fixture for Claude response normalizer (stateless, shared across the class)."""
         return ClaudeResponseNormalizer()
 
     def test_standard_error_format(self, normalizer):
@@ -323,9 +328,10 @@ class TestClaudeErrorNormalization:
 class TestClaudeEdgeCases:
     """Test edge cases and special scenarios."""
 
-    @pytest.fixture
-    def normalizer(self):
-        """Create a Claude response normalizer instance."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def normalizer(cls):
+        """Fixture for Claude response normalizer (stateless, shared across the class)."""
         return ClaudeResponseNormalizer()
 
     def test_empty_content_blocks(self, normalizer):
@@ -399,9 +405,10 @@ class TestClaudeEdgeCases:
 class TestClaudeContentExtraction:
     """Test content extraction from various block types."""
 
-    @pytest.fixture
-    def normalizer(self):
-        """Create a Claude response normalizer instance."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def normalizer(cls):
+        """Fixture for Claude response normalizer (stateless, shared across the class)."""
         return ClaudeResponseNormalizer()
 
     def test_single_text_block(self, normalizer):
@@ -330,6 +330,7 @@ class TestConvenienceMethods:
 
                 anthropic = client.registry.get_provider("anthropic")
                 assert anthropic.config.priority == 1
+                assert client.registry.get_next_available_provider() is anthropic
 
     def test_get_provider_status_specific(self, client):
         """Test getting status of specific provider."""
@@ -4,7 +4,45 @@ import pytest
 
 from flexiai.circuit_breaker import CircuitBreaker, CircuitState
 from flexiai.exceptions import ProviderException
-from flexiai.models import CircuitBreakerConfig
+from flexiai.models import CircuitBreakerConfig, Message, UsageInfo
+
+# Invalid YAML syntax
+_INVALID_YAML = """
+providers:
+  - name: openai
+    priority: 1
+  - invalid_indentation_here
+"""
+
+# Invalid JSON syntax (missing quotes around key)
+_INVALID_JSON = '{invalid_key: "value"}'
+
+_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "get_weather",
+            "description": "Get weather",
+            "parameters": {"type": "object", "properties": {}},
+        },
+    }
+]
+
+# Pre-built messages for tests that only read attributes back; tests exercising
+# Message validation must keep using the real constructor
+_USER_MSG = Message.model_construct(role="user", content="What's the weather?")
+
+# Usage payload shared by response tests that don't assert on usage
+_USAGE = UsageInfo.model_construct(prompt_tokens=10, completion_tokens=5, total_tokens=15)
+
+
+@pytest.fixture(scope="module")
+def closed_breaker():
+    """Circuit breaker left in the CLOSED state, shared by read-only tests."""
+    config = CircuitBreakerConfig(
+        failure_threshold=3, recovery_timeout=2, expected_exception=["ProviderException"]
+    )
+    return CircuitBreaker(name="test", config=config)
 
 
 class TestCircuitBreakerEdgeCases:
@@ -113,23 +151,24 @@ class TestCircuitBreakerEdgeCases:
         # Failure count is reset on close
         assert breaker.state.failure_count == 0
 
-    def test_state_transition_no_change(self):
+    def test_state_transition_no_change(self, closed_breaker):
         """Test that transitioning to the same state doesn't do anything."""
-        config = CircuitBreakerConfig(
-            failure_threshold=3, recovery_timeout=2, expected_exception=["ProviderException"]
-        )
-        breaker = CircuitBreaker(name="test", config=config)
+        transitions = []
 
-        # Circuit starts in CLOSED state
-        assert breaker.is_closed()
+        def listener(old_state, new_state):
+            transitions.append(new_state)
+
+        closed_breaker.add_state_change_listener(listener)
 
         # Manually try to transition to CLOSED again (should be no-op)
-        old_state = breaker.state.state
-        breaker._transition_to(CircuitState.CLOSED)
+        try:
+            closed_breaker._transition_to(CircuitState.CLOSED)
+        finally:
+            closed_breaker.remove_state_change_listener(listener)
 
-        # State should still be CLOSED, no error
-        assert breaker.is_closed()
-        assert breaker.state.state == old_state
+        # State should still be CLOSED and no listener should have fired
+        assert closed_breaker.is_closed()
+        assert transitions == []
 
 
 class TestConfigEdgeCases:
@@ -139,26 +178,15 @@ class TestConfigEdgeCases:
         """Test config loading from invalid YAML."""
         from flexiai.config import ConfigLoader
 
-        # Invalid YAML syntax
-        invalid_yaml = """
-        providers:
-          - name: openai
-            priority: 1
-          - invalid_indentation_here
-        """
-
         with pytest.raises(Exception):  # Should raise yaml.YAMLError or similar
-            ConfigLoader.from_yaml_string(invalid_yaml)
+            ConfigLoader.from_yaml_string(_INVALID_YAML)
 
     def test_config_from_json_with_invalid_json(self):
         """Test config loading from invalid JSON."""
         from flexiai.config import ConfigLoader
 
-        # Invalid JSON syntax (missing quotes around key)
-        invalid_json = '{invalid_key: "value"}'
-
         with pytest.raises(Exception):  # Should raise json.JSONDecodeError
-            ConfigLoader.from_json_string(invalid_json)
+            ConfigLoader.from_json_string(_INVALID_JSON)
 
 
 class TestClientEdgeCases:
@@ -199,29 +227,19 @@ class TestModelsEdgeCases:
 
     def test_unified_request_with_tools(self):
         """Test UnifiedRequest with tools parameter."""
-        from flexiai.models import Message, UnifiedRequest
-
-        tools = [
-            {
-                "type": "function",
-                "function": {
-                    "name": "get_weather",
-                    "description": "Get weather",
-                    "parameters": {"type": "object", "properties": {}},
-                },
-            }
-        ]
+        from flexiai.models import UnifiedRequest
 
         request = UnifiedRequest(
-            messages=[Message(role="user", content="What's the weather?")],
-            tools=tools,
+            messages=[_USER_MSG],
+            tools=_TOOLS,
             temperature=0.7,
         )
 
-        assert request.tools == tools
+        assert request.tools == _TOOLS
         assert len(request.messages) == 1
 
-    def test_provider_config_with_invalid_priority(self):
+    @pytest.mark.parametrize("priority", [0, -1])
+    def test_provider_config_with_invalid_priority(self, priority):
         """Test ProviderConfig with invalid priority value."""
         from pydantic import ValidationError
 
@@ -229,14 +247,11 @@ class TestModelsEdgeCases:
 
         # Priority must be >= 1
         with pytest.raises(ValidationError):
-            ProviderConfig(name="openai", priority=0, api_key="test-key", model="gpt-4")  # Invalid
-
-        with pytest.raises(ValidationError):
-            ProviderConfig(name="openai", priority=-1, api_key="test-key", model="gpt-4")  # Invalid
+            ProviderConfig(name="openai", priority=priority, api_key="test-key", model="gpt-4")
 
     def test_unified_response_with_minimal_fields(self):
         """Test UnifiedResponse with only required fields."""
-        from flexiai.models import UnifiedResponse, UsageInfo
+        from flexiai.models import UnifiedResponse
 
         # Create with minimal required fields
         response = UnifiedResponse(
@@ -244,7 +259,7 @@ class TestModelsEdgeCases:
             model="gpt-4",
             provider="openai",  # Required field
             finish_reason="stop",
-            usage=UsageInfo(prompt_tokens=10, completion_tokens=5, total_tokens=15),
+            usage=_USAGE,
         )
 
         assert response.content == "Hello"
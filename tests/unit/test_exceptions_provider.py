@@ -0,0 +1,316 @@
+"""
+Unit tests for FlexiAI provider exceptions.
+
+Tests ProviderException, its subclasses, the remaining runtime errors and the
+exception inheritance hierarchy.
+"""
+
+import pytest
+
+from flexiai.exceptions import (
+    AllProvidersFailedError,
+    APIConnectionError,
+    AuthenticationError,
+    CircuitBreakerOpenError,
+    ConfigurationError,
+    ContentFilterError,
+    FlexiAIException,
+    InvalidResponseError,
+    ModelNotFoundError,
+    ProviderException,
+    RateLimitError,
+    TimeoutError,
+    ValidationError,
+)
+
+
+def _assert_matches(actual, expected, label):
+    """Compare bools and ``None`` by identity, everything else by equality."""
+    if isinstance(expected, bool) or expected is None:
+        assert actual is expected, f"{label}: {actual!r} is not {expected!r}"
+    else:
+        assert actual == expected, f"{label}: {actual!r} != {expected!r}"
+
+
+def _assert_exception(exc, attrs, details):
+    """Assert exception attributes and that ``details`` holds the expected entries."""
+    for name, value in attrs.items():
+        _assert_matches(getattr(exc, name), value, name)
+    for key, value in details.items():
+        assert key in exc.details
+        _assert_matches(exc.details[key], value, f"details[{key!r}]")
+
+
+class TestProviderException:
+    """Tests for ProviderException."""
+
+    @pytest.mark.parametrize(
+        "kwargs,attrs,details",
+        [
+            ({}, {"provider": None, "is_retryable": True}, {"retryable": True}),
+            (
+                {"provider": "openai"},
+                {"provider": "openai", "is_retryable": True},
+                {"provider": "openai"},
+            ),
+            ({"is_retryable": False}, {"is_retryable": False}, {"retryable": False}),
+        ],
+        ids=["basic", "with_provider", "not_retryable"],
+    )
+    def test_provider_exception(self, kwargs, attrs, details):
+        """Test creating provider exception with optional parameters."""
+        exc = ProviderException("API error", **kwargs)
+        assert "Provider Error:" in exc.message
+        _assert_exception(exc, attrs, details)
+
+
+class TestRateLimitError:
+    """Tests for RateLimitError."""
+
+    @pytest.mark.parametrize(
+        "kwargs,attrs,details",
+        [
+            ({}, {"is_retryable": True, "retry_after": None}, {}),
+            ({"retry_after": 60}, {"retry_after": 60}, {"retry_after": 60}),
+            (
+                {"provider": "openai", "retry_after": 30},
+                {"provider": "openai", "retry_after": 30},
+                {"provider": "openai", "retry_after": 30},
+            ),
+        ],
+        ids=["basic", "with_retry_after", "with_provider"],
+    )
+    def test_rate_limit_error(self, kwargs, attrs, details):
+        """Test creating rate limit error with optional parameters."""
+        exc = RateLimitError("Rate limit exceeded", **kwargs)
+        assert "Rate limit exceeded" in exc.message
+        _assert_exception(exc, attrs, details)
+
+
+class TestTimeoutError:
+    """Tests for TimeoutError."""
+
+    @pytest.mark.parametrize(
+        "kwargs,attrs,details",
+        [
+            ({}, {"is_retryable": True, "timeout": None}, {}),
+            ({"timeout": 30}, {"timeout": 30}, {"timeout": 30}),
+            (
+                {"provider": "openai", "timeout": 30},
+                {"provider": "openai", "timeout": 30},
+                {"provider": "openai", "timeout": 30},
+            ),
+        ],
+        ids=["basic", "with_timeout_value", "with_provider"],
+    )
+    def test_timeout_error(self, kwargs, attrs, details):
+        """Test creating timeout error with optional parameters."""
+        exc = TimeoutError("Request timed out", **kwargs)
+        assert "Request timed out" in exc.message
+        _assert_exception(exc, attrs, details)
+
+
+class TestAPIConnectionError:
+    """Tests for APIConnectionError."""
+
+    @pytest.mark.parametrize(
+        "kwargs,attrs,details",
+        [
+            ({}, {"is_retryable": True}, {}),
+            ({"provider": "openai"}, {"provider": "openai"}, {"provider": "openai"}),
+            (
+                {
+                    "provider": "openai",
+                    "details": {
+                        "endpoint": "https://api.openai.com",
+                        "reason": "Connection refused",
+                    },
+                },
+                {"provider": "openai"},
+                {"endpoint": "https://api.openai.com", "reason": "Connection refused"},
+            ),
+        ],
+        ids=["basic", "with_provider", "with_details"],
+    )
+    def test_api_connection_error(self, kwargs, attrs, details):
+        """Test creating API connection error with optional parameters."""
+        exc = APIConnectionError("Failed to connect", **kwargs)
+        assert "Failed to connect" in exc.message
+        _assert_exception(exc, attrs, details)
+
+
+class TestCircuitBreakerOpenError:
+    """Tests for CircuitBreakerOpenError."""
+
+    @pytest.mark.parametrize(
+        "kwargs,attrs,details",
+        [
+            ({}, {"provider": None, "failure_count": None}, {}),
+            ({"provider": "openai"}, {"provider": "openai"}, {"provider": "openai"}),
+            ({"failure_count": 5}, {"failure_count": 5}, {"failure_count": 5}),
+            (
+                {"provider": "openai", "failure_count": 5, "details": {"recovery_timeout": 60}},
+                {"provider": "openai", "failure_count": 5},
+                {"provider": "openai", "failure_count": 5, "recovery_timeout": 60},
+            ),
+        ],
+        ids=["basic", "with_provider", "with_failure_count", "with_all_params"],
+    )
+    def test_circuit_breaker_open_error(self, kwargs, attrs, details):
+        """Test creating circuit breaker open error with optional parameters."""
+        exc = CircuitBreakerOpenError("Circuit breaker is OPEN", **kwargs)
+        assert "Circuit Breaker:" in exc.message
+        _assert_exception(exc, attrs, details)
+
+
+class TestAllProvidersFailedError:
+    """Tests for AllProvidersFailedError."""
+
+    def test_all_providers_failed_error(self):
+        """Test creating all providers failed error."""
+        exc = AllProvidersFailedError("All providers failed")
+        assert "All Providers Failed:" in exc.message
+
+    def test_all_providers_failed_error_with_provider_errors(self):
+        """Test all providers failed error with provider errors."""
+        provider_errors = {
+            "openai": "Rate limit exceeded",
+            "gemini": "Connection failed",
+            "anthropic": "Circuit breaker open",
+        }
+        exc = AllProvidersFailedError("All providers failed", provider_errors=provider_errors)
+        assert exc.provider_errors == provider_errors
+        assert exc.details["provider_errors"] == provider_errors
+
+    def test_all_providers_failed_error_str_includes_errors(self):
+        """Test that string representation includes all provider errors."""
+        provider_errors = {"openai": "Error 1", "gemini": "Error 2"}
+        exc = AllProvidersFailedError("Failed", provider_errors=provider_errors)
+        error_str = str(exc)
+        assert "openai" in error_str
+        assert "Error 1" in error_str
+        assert "gemini" in error_str
+        assert "Error 2" in error_str
+
+
+class TestContentFilterError:
+    """Tests for ContentFilterError."""
+
+    @pytest.mark.parametrize(
+        "kwargs,attrs,details",
+        [
+            ({}, {"is_retryable": False}, {"retryable": False}),
+            ({"provider": "gemini"}, {"provider": "gemini"}, {"provider": "gemini"}),
+            (
+                {"provider": "gemini", "details": {"category": "harassment", "severity": "high"}},
+                {"provider": "gemini"},
+                {"category": "harassment", "severity": "high"},
+            ),
+        ],
+        ids=["basic", "with_provider", "with_details"],
+    )
+    def test_content_filter_error(self, kwargs, attrs, details):
+        """Test creating content filter error with optional parameters."""
+        exc = ContentFilterError("Content filtered", **kwargs)
+        assert "Content filtered" in exc.message
+        _assert_exception(exc, attrs, details)
+
+
+class TestModelNotFoundError:
+    """Tests for ModelNotFoundError."""
+
+    @pytest.mark.parametrize(
+        "kwargs,attrs,details",
+        [
+            ({}, {"is_retryable": False, "model": None}, {}),
+            ({"model": "gpt-5"}, {"model": "gpt-5"}, {"model": "gpt-5"}),
+            (
+                {"provider": "openai", "model": "gpt-5"},
+                {"provider": "openai", "model": "gpt-5"},
+                {"provider": "openai", "model": "gpt-5"},
+            ),
+        ],
+        ids=["basic", "with_model_name", "with_provider"],
+    )
+    def test_model_not_found_error(self, kwargs, attrs, details):
+        """Test creating model not found error with optional parameters."""
+        exc = ModelNotFoundError("Model not found", **kwargs)
+        assert "Model not found" in exc.message
+        _assert_exception(exc, attrs, details)
+
+
+class TestInvalidResponseError:
+    """Tests for InvalidResponseError."""
+
+    @pytest.mark.parametrize(
+        "kwargs,attrs,details",
+        [
+            ({}, {"is_retryable": False}, {"retryable": False}),
+            ({"provider": "openai"}, {"provider": "openai"}, {"provider": "openai"}),
+            (
+                {
+                    "provider": "openai",
+                    "details": {"error": "Missing required field", "field": "content"},
+                },
+                {"provider": "openai"},
+                {"error": "Missing required field", "field": "content"},
+            ),
+        ],
+        ids=["basic", "with_provider", "with_details"],
+    )
+    def test_invalid_response_error(self, kwargs, attrs, details):
+        """Test creating invalid response error with optional parameters."""
+        exc = InvalidResponseError("Invalid JSON", **kwargs)
+        assert "Invalid JSON" in exc.message
+        _assert_exception(exc, attrs, details)
+
+
+class TestExceptionInheritance:
+    """Tests for exception inheritance hierarchy."""
+
+    def test_all_exceptions_inherit_from_base(self):
+        """Test that all custom exceptions inherit from FlexiAIException."""
+        exceptions = [
+            ConfigurationError("test"),
+            ValidationError("test"),
+            AuthenticationError("test"),
+            ProviderException("test"),
+            RateLimitError("test"),
+            TimeoutError("test"),
+            APIConnectionError("test"),
+            CircuitBreakerOpenError("test"),
+            AllProvidersFailedError("test"),
+            ContentFilterError("test"),
+            ModelNotFoundError("test"),
+            InvalidResponseError("test"),
+        ]
+        for exc in exceptions:
+            assert isinstance(exc, FlexiAIException)
+            assert isinstance(exc, Exception)
+
+    def test_provider_specific_exceptions_inherit_from_provider_exception(self):
+        """Test that provider-specific exceptions inherit from ProviderException."""
+        exceptions = [
+            RateLimitError("test"),
+            TimeoutError("test"),
+            APIConnectionError("test"),
+            ContentFilterError("test"),
+            ModelNotFoundError("test"),
+            InvalidResponseError("test"),
+        ]
+        for exc in exceptions:
+            assert isinstance(exc, ProviderException)
+
+    def test_can_catch_all_with_base_exception(self):
+        """Test that all exceptions can be caught with base exception."""
+        try:
+            raise RateLimitError("Rate limit")
+        except FlexiAIException as e:
+            assert "Rate limit" in str(e)
+
+    def test_can_catch_provider_exceptions(self):
+        """Test that provider exceptions can be caught specifically."""
+        try:
+            raise TimeoutError("Timeout")
+        except ProviderException as e:
+            assert "Timeout" in str(e)
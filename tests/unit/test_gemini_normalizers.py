@@ -5,32 +5,62 @@ Tests the normalization of requests and responses between FlexiAI's
 unified format and Gemini's API format.
 """
 
-from unittest.mock import Mock
+from types import SimpleNamespace
 
 import pytest
+from google.genai.types import FinishReason
+from pydantic import ValidationError as PydanticValidationError
 
+from flexiai.exceptions import ProviderException
 from flexiai.models import Message, UnifiedRequest
 from flexiai.normalizers.request import GeminiRequestNormalizer
 from flexiai.normalizers.response import GeminiResponseNormalizer
 
 
+def _make_response(finish_reason, text="Response", usage=(5, 5, 10)):
+    """Build a Gemini response dict (as produced by ``_response_to_dict``)."""
+    prompt_tokens, candidates_tokens, total_tokens = usage
+    return {
+        "candidates": [
+            {
+                "content": {"parts": [{"text": text}]},
+                "finishReason": finish_reason,
+                "safetyRatings": [],
+            }
+        ],
+        "usageMetadata": {
+            "promptTokenCount": prompt_tokens,
+            "candidatesTokenCount": candidates_tokens,
+            "totalTokenCount": total_tokens,
+        },
+    }
+
+
+@pytest.fixture(scope="module")
+def simple_user_request():
+    """Single-message request shared read-only across tests; copy before changing."""
+    return UnifiedRequest(messages=[Message(role="user", content="Hello")])
+
+
 class TestGeminiRequestNormalizer:
     """Tests for GeminiRequestNormalizer."""
 
-    @pytest.fixture
-    def normalizer(self):
-        """Fixture for request normalizer."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def normalizer(cls):
+        """Fixture for request normalizer (stateless, shared across the class)."""
         return GeminiRequestNormalizer()
 
-    def test_basic_message_normalization(self, normalizer):
-        """Test basic message format conversion."""
-        request = UnifiedRequest(
-            messages=[
-                Message(role="user", content="Hello, Gemini!"),
-            ],
-        )
+    @pytest.fixture(scope="class")
+    @classmethod
+    def basic_normalized(cls, normalizer):
+        """Single user message request and its normalized form, built once per class."""
+        request = UnifiedRequest(messages=[Message(role="user", content="Hello, Gemini!")])
+        return request, normalizer.normalize(request)
 
-        normalized = normalizer.normalize(request)
+    def test_basic_message_normalization(self, basic_normalized):
+        """Test basic message format conversion."""
+        _, normalized = basic_normalized
 
         assert "contents" in normalized
         assert len(normalized["contents"]) == 1
@@ -93,56 +123,27 @@ class TestGeminiRequestNormalizer:
         assert "You are helpful." in system_text
         assert "You are concise." in system_text
 
-    def test_parameter_mapping_temperature(self, normalizer):
-        """Test temperature parameter mapping."""
-        request = UnifiedRequest(
-            messages=[Message(role="user", content="Hello")],
-            temperature=0.8,
-        )
-
-        normalized = normalizer.normalize(request)
-
-        assert "generationConfig" in normalized
-        assert normalized["generationConfig"]["temperature"] == 0.8
-
-    def test_parameter_mapping_max_tokens(self, normalizer):
-        """Test max_tokens to maxOutputTokens mapping."""
-        request = UnifiedRequest(
-            messages=[Message(role="user", content="Hello")],
-            max_tokens=1000,
-        )
-
-        normalized = normalizer.normalize(request)
-
-        assert "generationConfig" in normalized
-        assert normalized["generationConfig"]["maxOutputTokens"] == 1000
-
-    def test_parameter_mapping_top_p(self, normalizer):
-        """Test top_p parameter mapping."""
-        request = UnifiedRequest(
-            messages=[Message(role="user", content="Hello")],
-            top_p=0.95,
-        )
-
-        normalized = normalizer.normalize(request)
-
-        assert "generationConfig" in normalized
-        assert normalized["generationConfig"]["topP"] == 0.95
-
-    def test_parameter_mapping_stop_sequences(self, normalizer):
-        """Test stop sequences parameter mapping."""
-        request = UnifiedRequest(
-            messages=[Message(role="user", content="Hello")],
-            stop=["END", "STOP"],
-        )
+    @pytest.mark.parametrize(
+        "field,config_key,value",
+        [
+            ("temperature", "temperature", 0.8),
+            ("max_tokens", "maxOutputTokens", 1000),
+            ("top_p", "topP", 0.95),
+            ("stop", "stopSequences", ["END", "STOP"]),
+        ],
+    )
+    def test_parameter_mapping(self, normalizer, simple_user_request, field, config_key, value):
+        """Test request parameters are mapped into generationConfig."""
+        request = simple_user_request.model_copy(update={field: value})
 
         normalized = normalizer.normalize(request)
 
-        assert "generationConfig" in normalized
-        assert normalized["generationConfig"]["stopSequences"] == ["END", "STOP"]
+        assert normalized["generationConfig"][config_key] == value
 
-    def test_all_parameters_together(self, normalizer):
-        """Test normalization with all parameters."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def all_params_normalized(cls, normalizer):
+        """Normalized request using every mapped parameter, built once per class."""
         request = UnifiedRequest(
             messages=[
                 Message(role="system", content="Be helpful."),
@@ -155,63 +156,66 @@ class TestGeminiRequestNormalizer:
             top_p=0.9,
             stop=["END"],
         )
+        return normalizer.normalize(request)
 
-        normalized = normalizer.normalize(request)
-
-        # Check system instruction
-        assert "system_instruction" in normalized
+    def test_all_parameters_messages(self, all_params_normalized):
+        """Test system instruction and contents when all parameters are set."""
+        assert "system_instruction" in all_params_normalized
 
         # Check contents (3 messages: user, assistant, user)
-        assert len(normalized["contents"]) == 3
-
-        # Check generation config
-        assert normalized["generationConfig"]["temperature"] == 0.7
-        assert normalized["generationConfig"]["maxOutputTokens"] == 500
-        assert normalized["generationConfig"]["topP"] == 0.9
-        assert normalized["generationConfig"]["stopSequences"] == ["END"]
+        assert len(all_params_normalized["contents"]) == 3
+
+    @pytest.mark.parametrize(
+        "config_key,expected",
+        [
+            ("temperature", 0.7),
+            ("maxOutputTokens", 500),
+            ("topP", 0.9),
+            ("stopSequences", ["END"]),
+        ],
+    )
+    def test_all_parameters_generation_config(self, all_params_normalized, config_key, expected):
+        """Test each generation config field when all parameters are set."""
+        assert all_params_normalized["generationConfig"][config_key] == expected
 
     def test_empty_messages_raises_error(self, normalizer):
         """Test that empty messages list raises ValidationError."""
         # Pydantic already validates this at model level
-        with pytest.raises(Exception):  # ValidationError from pydantic
+        with pytest.raises(PydanticValidationError):
             _ = UnifiedRequest(messages=[])
 
-    def test_model_support_validation(self, normalizer):
+    @pytest.mark.parametrize(
+        "model,supported",
+        [
+            ("gemini-2.5-pro", True),
+            ("gemini-2.0-flash", True),
+            ("gemini-1.5-pro", True),
+            ("gemini-pro", True),
+            ("gpt-4", False),
+            ("claude-3", False),
+        ],
+    )
+    def test_model_support_validation(self, normalizer, model, supported):
         """Test model support validation."""
-        assert normalizer.validate_model_support("gemini-2.5-pro") is True
-        assert normalizer.validate_model_support("gemini-2.0-flash") is True
-        assert normalizer.validate_model_support("gemini-1.5-pro") is True
-        assert normalizer.validate_model_support("gemini-pro") is True
-        assert normalizer.validate_model_support("gpt-4") is False
-        assert normalizer.validate_model_support("claude-3") is False
+        assert normalizer.validate_model_support(model) is supported
 
 
 class TestGeminiResponseNormalizer:
     """Tests for GeminiResponseNormalizer."""
 
-    @pytest.fixture
-    def normalizer(self):
-        """Fixture for response normalizer."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def normalizer(cls):
+        """Fixture for response normalizer (stateless, shared across the class)."""
         return GeminiResponseNormalizer()
 
     def test_basic_response_normalization(self, normalizer):
         """Test basic response normalization."""
         # Create response dict in Gemini format (after _response_to_dict conversion)
-        response_dict = {
-            "candidates": [
-                {
-                    "content": {"parts": [{"text": "Hello! How can I help you today?"}]},
-                    "finishReason": "STOP",
-                    "safetyRatings": [],
-                }
-            ],
-            "usageMetadata": {
-                "promptTokenCount": 10,
-                "candidatesTokenCount": 15,
-                "totalTokenCount": 25,
-            },
-            "modelVersion": "gemini-2.0-flash-exp",
-        }
+        response_dict = _make_response(
+            "STOP", text="Hello! How can I help you today?", usage=(10, 15, 25)
+        )
+        response_dict["modelVersion"] = "gemini-2.0-flash-exp"
 
         unified_response = normalizer.normalize(
             response_dict, provider_name="gemini", model="gemini-2.0-flash-exp"
@@ -225,102 +229,35 @@ class TestGeminiResponseNormalizer:
         assert unified_response.usage.total_tokens == 25
         assert unified_response.finish_reason == "stop"
 
-    def test_finish_reason_stop(self, normalizer):
-        """Test STOP finish reason normalization."""
-        response_dict = {
-            "candidates": [
-                {
-                    "content": {"parts": [{"text": "Done"}]},
-                    "finishReason": "STOP",
-                    "safetyRatings": [],
-                }
-            ],
-            "usageMetadata": {
-                "promptTokenCount": 5,
-                "candidatesTokenCount": 5,
-                "totalTokenCount": 10,
-            },
-        }
-
+    @pytest.mark.parametrize(
+        "finish_reason,expected",
+        [
+            ("STOP", "stop"),
+            ("MAX_TOKENS", "length"),
+            ("OTHER", "unknown"),  # OTHER/RECITATION map to unknown
+        ],
+    )
+    def test_finish_reason_mapping(self, normalizer, finish_reason, expected):
+        """Test finish reason normalization."""
         unified_response = normalizer.normalize(
-            response_dict, provider_name="gemini", model="gemini-2.0-flash-exp"
+            _make_response(finish_reason), provider_name="gemini", model="gemini-2.0-flash-exp"
         )
-        assert unified_response.finish_reason == "stop"
-
-    def test_finish_reason_max_tokens(self, normalizer):
-        """Test MAX_TOKENS finish reason normalization."""
-        response_dict = {
-            "candidates": [
-                {
-                    "content": {"parts": [{"text": "Incomplete"}]},
-                    "finishReason": "MAX_TOKENS",
-                    "safetyRatings": [],
-                }
-            ],
-            "usageMetadata": {
-                "promptTokenCount": 5,
-                "candidatesTokenCount": 100,
-                "totalTokenCount": 105,
-            },
-        }
-
-        unified_response = normalizer.normalize(
-            response_dict, provider_name="gemini", model="gemini-2.0-flash-exp"
-        )
-        assert unified_response.finish_reason == "length"
+        assert unified_response.finish_reason == expected
 
     def test_finish_reason_safety(self, normalizer):
         """Test SAFETY finish reason normalization."""
-        from google.genai.types import FinishReason
-
-        mock_response = Mock()
-        mock_response.text = None
-        mock_response.candidates = [Mock()]
-        mock_response.candidates[0].finish_reason = FinishReason.SAFETY
-        mock_response.candidates[0].content = None
+        blocked_response = SimpleNamespace(
+            text=None,
+            candidates=[SimpleNamespace(finish_reason=FinishReason.SAFETY, content=None)],
+        )
 
         # Should raise exception for blocked content
-        with pytest.raises(Exception):  # Provider will handle this
-            normalizer.normalize(mock_response, "gemini-2.0-flash-exp", "gemini")
-
-    def test_finish_reason_other(self, normalizer):
-        """Test OTHER/RECITATION finish reason normalization."""
-        response_dict = {
-            "candidates": [
-                {
-                    "content": {"parts": [{"text": "Response"}]},
-                    "finishReason": "OTHER",
-                    "safetyRatings": [],
-                }
-            ],
-            "usageMetadata": {
-                "promptTokenCount": 5,
-                "candidatesTokenCount": 5,
-                "totalTokenCount": 10,
-            },
-        }
-
-        unified_response = normalizer.normalize(
-            response_dict, provider_name="gemini", model="gemini-2.0-flash-exp"
-        )
-        assert unified_response.finish_reason == "unknown"  # OTHER maps to unknown
+        with pytest.raises(ProviderException):  # Provider will handle this
+            normalizer.normalize(blocked_response, "gemini-2.0-flash-exp", "gemini")
 
     def test_usage_metadata_extraction(self, normalizer):
         """Test token usage metadata extraction."""
-        response_dict = {
-            "candidates": [
-                {
-                    "content": {"parts": [{"text": "Test"}]},
-                    "finishReason": "STOP",
-                    "safetyRatings": [],
-                }
-            ],
-            "usageMetadata": {
-                "promptTokenCount": 100,
-                "candidatesTokenCount": 50,
-                "totalTokenCount": 150,
-            },
-        }
+        response_dict = _make_response("STOP", text="Test", usage=(100, 50, 150))
 
         unified_response = normalizer.normalize(
             response_dict, provider_name="gemini", model="gemini-2.0-flash-exp"
@@ -332,16 +269,8 @@ class TestGeminiResponseNormalizer:
 
     def test_missing_usage_metadata(self, normalizer):
         """Test handling of missing usage metadata."""
-        response_dict = {
-            "candidates": [
-                {
-                    "content": {"parts": [{"text": "Response"}]},
-                    "finishReason": "STOP",
-                    "safetyRatings": [],
-                }
-            ],
-            "usageMetadata": {},  # Missing token counts
-        }
+        response_dict = _make_response("STOP")
+        response_dict["usageMetadata"] = {}  # Missing token counts
 
         unified_response = normalizer.normalize(
             response_dict, provider_name="gemini", model="gemini-2.0-flash-exp"
@@ -354,22 +283,10 @@ class TestGeminiResponseNormalizer:
 
     def test_metadata_preservation(self, normalizer):
         """Test that Gemini-specific metadata is preserved."""
-        response_dict = {
-            "candidates": [
-                {
-                    "content": {"parts": [{"text": "Response"}]},
-                    "finishReason": "STOP",
-                    "safetyRatings": [
-                        {"category": "HARM_CATEGORY_HATE_SPEECH", "probability": "NEGLIGIBLE"}
-                    ],
-                }
-            ],
-            "usageMetadata": {
-                "promptTokenCount": 10,
-                "candidatesTokenCount": 10,
-                "totalTokenCount": 20,
-            },
-        }
+        response_dict = _make_response("STOP", usage=(10, 10, 20))
+        response_dict["candidates"][0]["safetyRatings"] = [
+            {"category": "HARM_CATEGORY_HATE_SPEECH", "probability": "NEGLIGIBLE"}
+        ]
 
         unified_response = normalizer.normalize(
             response_dict, provider_name="gemini", model="gemini-2.0-flash-exp"
@@ -6,12 +6,70 @@ and correlation ID functionality.
 """
 
 import logging
-import tempfile
+from logging.handlers import MemoryHandler, QueueHandler
 from pathlib import Path
-
-from flexiai.utils.logger import CorrelationIdFilter, FlexiAILogger, SensitiveDataFilter, get_logger
-
-
+from typing import List
+from unittest.mock import patch
+
+import pytest
+
+from flexiai.utils.logger import (
+    _SENSITIVE_ANY,
+    _SENSITIVE_ANY_RE2,
+    RE2_AVAILABLE,
+    CorrelationIdFilter,
+    FlexiAILogger,
+    SensitiveDataFilter,
+    _re2_ascii_pattern,
+    get_logger,
+)
+
+
+class _FakeRecord:
+    """Minimal stand-in for ``logging.LogRecord`` carrying only what the filters read."""
+
+    __slots__ = ("msg", "args", "name", "levelno", "correlation_id")
+
+    def __init__(self, msg: object) -> None:
+        self.msg = msg
+        self.args = ()
+        self.name = "test"
+        self.levelno = logging.INFO
+
+
+def _ascii_scan_corpus() -> List[str]:
+    """ASCII messages around every sensitive pattern, with all kinds of separators."""
+    separators = [" ", "\t", "\n", "\r", "\x0b", "\x0c", "\x1c", "\x1f", "", ":", "=", ": "]
+    prefixes = ["sk-", "SK-", "key-", "Bearer", "bearer", "token", 'TOKEN"', "'api_key':"]
+    prefixes += ['"API_KEY":', "Authorization", "authorization'", "author", "keys"]
+    values = ["abc123def456", "abc", "'abc123def456'", '"x.y_z~+/="', "", "abc123 def"]
+    corpus = ["", "hello world", "no secrets here", "tokenizer", "monkey-business"]
+    for prefix in prefixes:
+        for separator in separators:
+            for value in values:
+                corpus.append(f"{prefix}{separator}{value}")
+                corpus.append(f"log: {prefix}{separator}{value} end")
+    return corpus
+
+
+@pytest.fixture(scope="module")
+def log_tmpdir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Directory shared by the file-logging tests; each test uses its own file name."""
+    return tmp_path_factory.mktemp("flexiai_logs")
+
+
+@pytest.fixture(params=["re", "re2"])
+def scan_engine(request, monkeypatch):
+    """Run masking with the stdlib ``re`` pre-scan and, if installed, the RE2 one."""
+    if request.param == "re2":
+        if not RE2_AVAILABLE:
+            pytest.skip("google-re2 not installed")
+    else:
+        monkeypatch.setattr("flexiai.utils.logger._SENSITIVE_ANY_RE2", None)
+    return request.param
+
+
+@pytest.mark.usefixtures("scan_engine")
 class TestSensitiveDataFilter:
     """Tests for SensitiveDataFilter."""
 
@@ -49,6 +107,29 @@ class TestSensitiveDataFilter:
         assert "abc123def456ghi789jkl012" not in masked
         assert "***MASKED***" in masked
 
+    def test_mask_bytes_payload(self) -> None:
+        """Test masking of secrets inside a bytes payload."""
+        filter_obj = SensitiveDataFilter()
+        data = b'Using API key: sk-1234567890abcdefghij {"api_key": "abc"}'
+        masked = filter_obj._mask_sensitive_bytes(data)
+        assert masked == b'Using API key: ***MASKED*** {"api_key": "***MASKED***"}'
+        assert filter_obj._mask_sensitive_bytes(b"model=gpt-4") == b"model=gpt-4"
+
+    def test_filter_bytes_log_record(self) -> None:
+        """Test that a bytes message stays bytes and is masked."""
+        filter_obj = SensitiveDataFilter()
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg=b"Authorization: Bearer abc123xyz456",
+            args=(),
+            exc_info=None,
+        )
+        filter_obj.filter(record)
+        assert record.msg == b"Authorization: ***MASKED***"
+
     def test_preserve_non_sensitive_data(self) -> None:
         """Test that non-sensitive data is preserved."""
         filter_obj = SensitiveDataFilter()
@@ -56,6 +137,66 @@ class TestSensitiveDataFilter:
         masked = filter_obj._mask_sensitive_data(text)
         assert masked == text
 
+    def test_clean_text_returned_unchanged(self) -> None:
+        """Test that text with nothing to mask is returned as-is after one scan."""
+        filter_obj = SensitiveDataFilter()
+        text = "model=gpt-4 temperature=0.7"
+        assert filter_obj._mask_sensitive_data(text) is text
+
+    def test_fast_path_no_regex_call(self) -> None:
+        """Test that text without any trigger substring never reaches the regexes."""
+        filter_obj = SensitiveDataFilter()
+        with patch("flexiai.utils.logger._SENSITIVE_ANY") as mock_pattern:
+            filter_obj._mask_sensitive_data("Initialized provider with model gpt-4o")
+        mock_pattern.search.assert_not_called()
+
+    def test_trigger_check_is_case_insensitive(self) -> None:
+        """Test that the substring pre-check does not skip differently cased secrets."""
+        filter_obj = SensitiveDataFilter()
+        masked = filter_obj._mask_sensitive_data("AUTHORIZATION: BEARER ABC123XYZ456")
+        assert "ABC123XYZ456" not in masked
+        assert "***MASKED***" in masked
+
+    def test_mask_overlapping_matches(self) -> None:
+        """Test that overlapping matches are fully masked."""
+        filter_obj = SensitiveDataFilter()
+        masked = filter_obj._mask_sensitive_data("Authorization: Bearer abc==def")
+        assert masked == "Authorization: ***MASKED***"
+        masked = filter_obj._mask_sensitive_data("Authorization:  tokentoken: abcdefgh12")
+        assert "abcdefgh12" not in masked
+
+    def test_mask_with_ascii_vertical_whitespace(self) -> None:
+        """Test that whitespace outside RE2's \\s (\\v, \\x1c) still gets masked."""
+        filter_obj = SensitiveDataFilter()
+        masked = filter_obj._mask_sensitive_data("Bearer\x0babc123xyz456 token=\x1cabc123def456")
+        assert "abc123xyz456" not in masked
+        assert "abc123def456" not in masked
+
+    def test_re2_ascii_pattern_widens_whitespace(self) -> None:
+        """Test that only \\s outside character classes is widened for RE2."""
+        assert _re2_ascii_pattern(r"a\s+b[^'\s]") == r"a[\s\x0b\x1c-\x1f]+b[^'\s]"
+
+    @pytest.mark.parametrize(
+        "pattern,expected",
+        [
+            (r"[]\s]\s", r"[]\s][\s\x0b\x1c-\x1f]"),
+            (r"[^]\s]\s", r"[^]\s][\s\x0b\x1c-\x1f]"),
+            (r"[a]\s", r"[a][\s\x0b\x1c-\x1f]"),
+        ],
+        ids=["leading_bracket", "negated_leading_bracket", "plain_class"],
+    )
+    def test_re2_ascii_pattern_leading_bracket_in_class(self, pattern: str, expected: str) -> None:
+        """Test that a literal "]" opening a class does not end the class early."""
+        assert _re2_ascii_pattern(pattern) == expected
+
+    @pytest.mark.skipif(not RE2_AVAILABLE, reason="google-re2 not installed")
+    def test_re2_pre_scan_agrees_with_re(self) -> None:
+        """Test the RE2 pre-scan finds the same matches as ``re`` on ASCII text."""
+        for text in _ascii_scan_corpus():
+            expected = _SENSITIVE_ANY.search(text)
+            found = _SENSITIVE_ANY_RE2.search(text)
+            assert (found and found.span()) == (expected and expected.span()), repr(text)
+
     def test_filter_log_record(self) -> None:
         """Test filtering of log records."""
         filter_obj = SensitiveDataFilter()
@@ -72,6 +213,27 @@ class TestSensitiveDataFilter:
         assert result is True
         assert "sk-test123456789" not in str(record.msg)
 
+    def test_filter_many_records(self) -> None:
+        """Test filtering a batch of records, masking only those holding secrets."""
+        filter_obj = SensitiveDataFilter()
+        records = [
+            _FakeRecord(f"request {i} api key sk-{i:020d}" if i % 2 else f"request {i} done")
+            for i in range(1000)
+        ]
+        assert all(filter_obj.filter(record) for record in records)
+        assert records[0].msg == "request 0 done"
+        assert records[1].msg == "request 1 api key ***MASKED***"
+        assert not any("sk-" in record.msg for record in records)
+
+    def test_patterns_compiled_once(self) -> None:
+        """Test that masking reuses the precompiled patterns instead of recompiling."""
+        with patch("flexiai.utils.logger.re.compile") as mock_compile:
+            filter_obj = SensitiveDataFilter()
+            for _ in range(10):
+                filter_obj._mask_sensitive_data("token=abc123def456ghi789jkl012")
+            FlexiAILogger.mask_sensitive_data({"model": "gpt-4", "note": "sk-1234567890abcdef"})
+        mock_compile.assert_not_called()
+
 
 class TestCorrelationIdFilter:
     """Tests for CorrelationIdFilter."""
@@ -111,14 +273,24 @@ class TestCorrelationIdFilter:
         filter_obj.filter(record)
         assert record.correlation_id == "N/A"
 
+    def test_correlation_id_on_many_records(self) -> None:
+        """Test that every record filtered inside a context gets its ID."""
+        filter_obj = CorrelationIdFilter()
+        records = [_FakeRecord("Test message") for _ in range(1000)]
+        with FlexiAILogger.correlation_context("batch-123"):
+            for record in records:
+                filter_obj.filter(record)
+        assert {record.correlation_id for record in records} == {"batch-123"}
+
 
 class TestFlexiAILogger:
     """Tests for FlexiAILogger class."""
 
     def setup_method(self) -> None:
         """Reset logger configuration before each test."""
+        FlexiAILogger.shutdown()
         FlexiAILogger._configured = False
-        FlexiAILogger._loggers = {}
+        FlexiAILogger._get_cached_logger.cache_clear()
         FlexiAILogger.clear_correlation_id()
         # Clear all handlers from flexiai logger
         logger = logging.getLogger("flexiai")
@@ -133,15 +305,34 @@ class TestFlexiAILogger:
         assert logger.level == logging.INFO
         assert len(logger.handlers) >= 1  # At least console handler
 
-    def test_setup_logging_with_file(self) -> None:
+    def test_setup_logging_with_file(
+        self, log_tmpdir: Path, request: pytest.FixtureRequest
+    ) -> None:
         """Test logging setup with file handler."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_file = Path(temp_dir) / "test.log"
-            FlexiAILogger.setup_logging(level="DEBUG", log_file=str(log_file))
+        log_file = log_tmpdir / f"{request.node.name}.log"
+        FlexiAILogger.setup_logging(level="DEBUG", log_file=str(log_file))
 
-            logger = logging.getLogger("flexiai")
-            assert logger.level == logging.DEBUG
-            assert log_file.exists()
+        logger = logging.getLogger("flexiai")
+        assert logger.level == logging.DEBUG
+        assert log_file.exists()
+        # File writes are handed to a background listener via a queue
+        assert any(isinstance(h, QueueHandler) for h in logger.handlers)
+        assert FlexiAILogger._listener is not None
+
+    def test_handlers_share_sensitive_filter(
+        self, log_tmpdir: Path, request: pytest.FixtureRequest
+    ) -> None:
+        """Test that console and file handlers reuse one masking filter."""
+        log_file = log_tmpdir / f"{request.node.name}.log"
+        FlexiAILogger.setup_logging(log_file=str(log_file))
+
+        sensitive_filters = {
+            id(f)
+            for h in logging.getLogger("flexiai").handlers
+            for f in h.filters
+            if isinstance(f, SensitiveDataFilter)
+        }
+        assert len(sensitive_filters) == 1
 
     def test_setup_logging_custom_format(self) -> None:
         """Test logging setup with custom format."""
@@ -223,6 +414,20 @@ class TestFlexiAILogger:
         masked = FlexiAILogger.mask_sensitive_data(data)
         assert all(item["api_key"] == "***MASKED***" for item in masked)
 
+    def test_mask_noop_returns_same_object(self) -> None:
+        """Test that data with nothing to mask is returned without copying."""
+        data = {"model": "gpt-4", "messages": [{"role": "user", "content": "Hi"}]}
+        assert FlexiAILogger.mask_sensitive_data(data) is data
+
+    def test_mask_shares_unchanged_subtrees(self) -> None:
+        """Test that only containers holding masked values are copied."""
+        data = {"config": {"api_key": "sk-secret"}, "messages": [{"role": "user"}]}
+        masked = FlexiAILogger.mask_sensitive_data(data)
+        assert masked is not data
+        assert masked["config"] == {"api_key": "***MASKED***"}
+        assert data["config"]["api_key"] == "sk-secret"
+        assert masked["messages"] is data["messages"]
+
     def test_mask_sensitive_data_string(self) -> None:
         """Test masking sensitive data in string."""
         data = "Using API key: sk-1234567890abcdef"
@@ -240,19 +445,104 @@ class TestFlexiAILogger:
         assert FlexiAILogger._is_sensitive_key("model") is False
         assert FlexiAILogger._is_sensitive_key("temperature") is False
 
-    def test_logging_masks_sensitive_data(self) -> None:
+    def test_is_sensitive_key_cached(self) -> None:
+        """Test that repeated key lookups are served from the cache."""
+        FlexiAILogger._is_sensitive_key.cache_clear()
+        for _ in range(3):
+            FlexiAILogger._is_sensitive_key("api_key")
+        assert FlexiAILogger._is_sensitive_key.cache_info().hits == 2
+
+    def test_logging_masks_sensitive_data(
+        self, log_tmpdir: Path, request: pytest.FixtureRequest
+    ) -> None:
         """Test that actual logging masks sensitive data."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_file = Path(temp_dir) / "test.log"
-            FlexiAILogger.setup_logging(level="INFO", log_file=str(log_file))
+        log_file = log_tmpdir / f"{request.node.name}.log"
+        FlexiAILogger.setup_logging(level="INFO", log_file=str(log_file))
 
-            logger = FlexiAILogger.get_logger()
+        logger = FlexiAILogger.get_logger()
+        with FlexiAILogger.correlation_context("corr-file-123"):
             logger.info("API key: sk-testsecretkey12345")
+        # Drain the background listener so the record reaches the file
+        FlexiAILogger.shutdown()
+
+        # Read log file and verify masking
+        log_content = log_file.read_text()
+        assert "sk-testsecretkey12345" not in log_content
+        assert "***MASKED***" in log_content
+        assert "[corr-file-123]" in log_content
+
+    def test_masking_skipped_when_level_disabled(self) -> None:
+        """Test that records below every handler's level are never masked."""
+        FlexiAILogger.setup_logging(level="INFO")
+        logger = FlexiAILogger.get_logger()
+
+        with patch.object(
+            SensitiveDataFilter, "_mask_sensitive_data", side_effect=lambda text: text
+        ) as mask:
+            # Console handler only accepts WARNING and above
+            logger.info("API key: sk-testsecretkey12345")
+            mask.assert_not_called()
+
+            logger.warning("API key: sk-testsecretkey12345")
+            mask.assert_called()
+
+    def test_file_logging_is_buffered_until_flush(
+        self, log_tmpdir: Path, request: pytest.FixtureRequest
+    ) -> None:
+        """Test that file records are batched and written out on shutdown."""
+        log_file = log_tmpdir / f"{request.node.name}.log"
+        FlexiAILogger.setup_logging(level="INFO", log_file=str(log_file), buffer_capacity=2)
+
+        # Drive the buffer directly so the listener thread's timing can't make
+        # an unwritten record look buffered
+        (handler,) = FlexiAILogger._listener.handlers
+        assert isinstance(handler, MemoryHandler)
+
+        def make_record(msg: str) -> logging.LogRecord:
+            return logging.makeLogRecord(
+                {
+                    "name": "flexiai",
+                    "levelno": logging.INFO,
+                    "levelname": "INFO",
+                    "msg": msg,
+                    "correlation_id": "N/A",
+                }
+            )
+
+        handler.handle(make_record("first record"))
+        assert len(handler.buffer) == 1
+        assert log_file.read_text() == ""
+
+        # Reaching capacity writes the whole batch
+        handler.handle(make_record("second record"))
+        assert handler.buffer == []
+        log_content = log_file.read_text()
+        assert "first record" in log_content
+        assert "second record" in log_content
+
+        FlexiAILogger.get_logger().info("buffered record")
+        FlexiAILogger.shutdown()
+        assert "buffered record" in log_file.read_text()
+
+    @pytest.mark.parametrize("value", ["", "lots", "-1"], ids=["empty", "text", "negative"])
+    def test_invalid_buffer_env_leaves_logging_untouched(
+        self,
+        log_tmpdir: Path,
+        request: pytest.FixtureRequest,
+        monkeypatch: pytest.MonkeyPatch,
+        value: str,
+    ) -> None:
+        """Test a bad FLEXIAI_LOG_BUF is rejected before any handler changes."""
+        monkeypatch.setenv("FLEXIAI_LOG_BUF", value)
+        logger = logging.getLogger("flexiai")
+        handlers_before = list(logger.handlers)
+
+        with pytest.raises(ValueError, match="FLEXIAI_LOG_BUF"):
+            FlexiAILogger.setup_logging(log_file=str(log_tmpdir / f"{request.node.name}.log"))
 
-            # Read log file and verify masking
-            log_content = log_file.read_text()
-            assert "sk-testsecretkey12345" not in log_content
-            assert "***MASKED***" in log_content
+        assert logger.handlers == handlers_before
+        assert FlexiAILogger._listener is None
+        assert not FlexiAILogger._configured
 
 
 class TestGetLogger:
@@ -260,8 +550,9 @@ class TestGetLogger:
 
     def setup_method(self) -> None:
         """Reset logger configuration."""
+        FlexiAILogger.shutdown()
         FlexiAILogger._configured = False
-        FlexiAILogger._loggers = {}
+        FlexiAILogger._get_cached_logger.cache_clear()
 
     def test_get_logger_default(self) -> None:
         """Test getting default logger."""
@@ -409,6 +409,20 @@ class TestFlexiAIConfig:
         assert len(config.providers) == 1
         assert config.providers[0].name == "openai"
 
+    def test_flexiai_config_roundtrip_preserves_types(self):
+        """Test that from_dict(to_dict()) rebuilds an equal config."""
+        config = FlexiAIConfig(
+            providers=[
+                ProviderConfig(name="gemini", priority=2, api_key="key-test", model="gemini-pro"),
+                ProviderConfig(name="openai", priority=1, api_key="sk-test123", model="gpt-4"),
+            ],
+            retry=RetryConfig(max_attempts=5),
+            default_max_tokens=256,
+        )
+        restored = FlexiAIConfig.from_dict(config.to_dict())
+        assert restored == config
+        assert isinstance(restored.retry, RetryConfig)
+
     def test_flexiai_config_with_all_sections(self):
         """Test config with all configuration sections."""
         config = FlexiAIConfig(
@@ -1,7 +1,6 @@
 """Tests for provider registry."""
 
-import threading
-from unittest.mock import Mock
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
@@ -10,13 +9,16 @@ from flexiai.exceptions import ProviderNotFoundError, ProviderRegistrationError
 from flexiai.models import CircuitBreakerConfig, ProviderConfig
 from flexiai.providers import BaseProvider, ProviderRegistry
 
+# Shared canned response so chat_completion does not build a Mock per call
+_MOCK_RESPONSE = object()
+
 
 class MockProvider(BaseProvider):
     """Mock provider for testing."""
 
     def chat_completion(self, request):
         """Mock chat completion."""
-        return Mock()
+        return _MOCK_RESPONSE
 
     def authenticate(self):
         """Mock authenticate."""
@@ -33,10 +35,8 @@ class MockProvider(BaseProvider):
 
 @pytest.fixture
 def registry():
-    """Create a fresh registry instance for each test."""
-    # Clear singleton instance and create new one
-    with ProviderRegistry._lock:
-        ProviderRegistry._instance = None
+    """Provide the singleton registry emptied for each test."""
+    # Empty the existing singleton in place rather than rebuilding it
     reg = ProviderRegistry()
     reg.clear()
     yield reg
@@ -44,6 +44,13 @@ def registry():
     reg.clear()
 
 
+@pytest.fixture(scope="module")
+def executor():
+    """Worker threads shared by the concurrency tests in this module."""
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        yield pool
+
+
 @pytest.fixture
 def provider_config():
     """Create a test provider configuration."""
@@ -122,6 +129,31 @@ class TestProviderRegistration:
 
         assert "already registered" in str(exc_info.value)
 
+    def test_register_many(self, registry):
+        """Test registering a batch of providers at once."""
+        configs = [
+            ProviderConfig(name="anthropic", priority=2, api_key="key", model="claude"),
+            ProviderConfig(name="openai", priority=1, api_key="key", model="gpt-4"),
+        ]
+
+        registry.register_many(MockProvider(config) for config in configs)
+
+        assert len(registry) == 2
+        assert [p.name for p in registry.get_providers_by_priority()] == ["openai", "anthropic"]
+
+    def test_register_many_duplicate_leaves_registry_unchanged(self, registry, provider):
+        """Test a batch containing a registered provider registers nothing."""
+        registry.register(provider)
+        gemini = MockProvider(
+            ProviderConfig(name="gemini", priority=2, api_key="key", model="gemini-pro")
+        )
+
+        with pytest.raises(ProviderRegistrationError, match="already registered"):
+            registry.register_many([gemini, provider])
+
+        assert "gemini" not in registry
+        assert len(registry) == 1
+
     def test_register_invalid_provider(self, registry):
         """Test registering non-BaseProvider raises TypeError."""
         with pytest.raises(TypeError) as exc_info:
@@ -220,6 +252,40 @@ class TestProviderPriority:
         assert providers[1].name == "gemini"  # priority 2
         assert providers[2].name == "anthropic"  # priority 3
 
+    def test_priority_order_follows_unregister(self, registry):
+        """Test that priority order stays correct as providers come and go."""
+        configs = [
+            ProviderConfig(name="anthropic", priority=3, api_key="key", model="claude"),
+            ProviderConfig(name="openai", priority=1, api_key="key", model="gpt-4"),
+            ProviderConfig(name="gemini", priority=2, api_key="key", model="gemini-pro"),
+        ]
+        for config in configs:
+            registry.register(MockProvider(config))
+
+        registry.unregister("openai")
+        assert registry.get_next_available_provider().name == "gemini"
+
+        registry.register(MockProvider(configs[1]))
+        names = [p.name for p in registry.get_providers_by_priority()]
+        assert names == ["openai", "gemini", "anthropic"]
+
+    def test_priority_order_follows_in_place_priority_change(self, registry):
+        """Test that mutating a registered provider's priority re-sorts selection."""
+        openai = MockProvider(
+            ProviderConfig(name="openai", priority=1, api_key="key", model="gpt-4")
+        )
+        gemini = MockProvider(
+            ProviderConfig(name="gemini", priority=2, api_key="key", model="gemini-pro")
+        )
+        registry.register_many([openai, gemini])
+        assert registry.get_next_available_provider().name == "openai"
+
+        gemini.config.priority = 0
+
+        assert registry.get_next_available_provider().name == "gemini"
+        names = [p.name for p in registry.get_providers_by_priority()]
+        assert names == ["gemini", "openai"]
+
     def test_get_providers_by_priority_only_available(self, registry):
         """Test only returns providers with closed circuit breakers."""
         # Register two providers
@@ -399,62 +465,40 @@ class TestCircuitBreakerControl:
 class TestRegistryThreadSafety:
     """Test thread safety of registry operations."""
 
-    def test_concurrent_registration(self, registry):
+    def test_concurrent_registration(self, registry, executor):
         """Test concurrent provider registration."""
-        errors = []
 
         def register_provider(name, priority):
-            try:
-                config = ProviderConfig(name=name, priority=priority, api_key="key", model="model")
-                registry.register(MockProvider(config))
-            except Exception as e:
-                errors.append(e)
-
-        # Create threads to register different providers
-        threads = []
-        for i, name in enumerate(["openai", "gemini", "anthropic"]):
-            thread = threading.Thread(target=register_provider, args=(name, i + 1))
-            threads.append(thread)
-            thread.start()
+            config = ProviderConfig(name=name, priority=priority, api_key="key", model="model")
+            registry.register(MockProvider(config))
 
-        # Wait for all threads
-        for thread in threads:
-            thread.join()
+        # Submit registrations of different providers to the worker threads
+        futures = [
+            executor.submit(register_provider, name, i + 1)
+            for i, name in enumerate(["openai", "gemini", "anthropic"])
+        ]
+
+        # result() re-raises any error from the worker
+        for future in futures:
+            future.result()
 
-        # Should have all three providers, no errors
+        # Should have all three providers
         assert len(registry) == 3
-        assert len(errors) == 0
 
-    def test_concurrent_access(self, registry):
+    def test_concurrent_access(self, registry, executor):
         """Test concurrent access to providers."""
         # Register providers
         for i, name in enumerate(["openai", "gemini"]):
             config = ProviderConfig(name=name, priority=i + 1, api_key="key", model="model")
             registry.register(MockProvider(config))
 
-        results = []
-        errors = []
-
         def access_provider():
-            try:
-                provider = registry.get_next_available_provider()
-                results.append(provider.name if provider else None)
-            except Exception as e:
-                errors.append(e)
-
-        # Create many threads
-        threads = []
-        for _ in range(10):
-            thread = threading.Thread(target=access_provider)
-            threads.append(thread)
-            thread.start()
-
-        # Wait for all
-        for thread in threads:
-            thread.join()
-
-        # Should have no errors
-        assert len(errors) == 0
+            provider = registry.get_next_available_provider()
+            return provider.name if provider else None
+
+        futures = [executor.submit(access_provider) for _ in range(10)]
+        results = [future.result() for future in futures]
+
         assert len(results) == 10
         # All should get openai (highest priority)
         assert all(r == "openai" for r in results)
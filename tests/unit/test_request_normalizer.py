@@ -23,9 +23,14 @@ class TestRequestNormalizerBase:
 class TestOpenAIRequestNormalizer:
     """Test OpenAI request normalizer."""
 
-    def test_normalize_simple_request(self) -> None:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def normalizer(cls):
+        """Fixture for request normalizer (stateless, shared across the class)."""
+        return OpenAIRequestNormalizer()
+
+    def test_normalize_simple_request(self, normalizer) -> None:
         """Test normalizing a simple request with minimal parameters."""
-        normalizer = OpenAIRequestNormalizer()
         request = UnifiedRequest(
             messages=[Message(role="user", content="Hello")],
         )
@@ -37,9 +42,8 @@ class TestOpenAIRequestNormalizer:
         assert result["messages"][0]["role"] == "user"
         assert result["messages"][0]["content"] == "Hello"
 
-    def test_normalize_request_with_temperature(self) -> None:
+    def test_normalize_request_with_temperature(self, normalizer) -> None:
         """Test normalizing request with temperature parameter."""
-        normalizer = OpenAIRequestNormalizer()
         request = UnifiedRequest(
             messages=[Message(role="user", content="Hello")],
             temperature=0.7,
@@ -49,9 +53,8 @@ class TestOpenAIRequestNormalizer:
 
         assert result["temperature"] == 0.7
 
-    def test_normalize_request_with_all_parameters(self) -> None:
+    def test_normalize_request_with_all_parameters(self, normalizer) -> None:
         """Test normalizing request with all supported parameters."""
-        normalizer = OpenAIRequestNormalizer()
         request = UnifiedRequest(
             messages=[Message(role="user", content="Hello")],
             temperature=0.8,
@@ -77,18 +80,16 @@ class TestOpenAIRequestNormalizer:
         assert result["seed"] == 42
         assert result["user"] == "test-user"
 
-    def test_normalize_empty_messages_raises_error(self) -> None:
+    def test_normalize_empty_messages_raises_error(self, normalizer) -> None:
         """Test that normalizing with empty messages raises ValidationError."""
-        normalizer = OpenAIRequestNormalizer()
         # Use model_construct to bypass Pydantic validation
         request = UnifiedRequest.model_construct(messages=[])
 
         with pytest.raises(ValidationError, match="at least one message"):
             normalizer.normalize(request)
 
-    def test_normalize_messages_system_and_user(self) -> None:
+    def test_normalize_messages_system_and_user(self, normalizer) -> None:
         """Test normalizing messages with system and user roles."""
-        normalizer = OpenAIRequestNormalizer()
         messages = [
             Message(role="system", content="You are helpful"),
             Message(role="user", content="Hello"),
@@ -102,9 +103,8 @@ class TestOpenAIRequestNormalizer:
         assert result[1]["role"] == "user"
         assert result[1]["content"] == "Hello"
 
-    def test_normalize_messages_with_name(self) -> None:
+    def test_normalize_messages_with_name(self, normalizer) -> None:
         """Test normalizing messages with name field."""
-        normalizer = OpenAIRequestNormalizer()
         messages = [
             Message(role="user", content="Hello", name="Alice"),
         ]
@@ -113,9 +113,8 @@ class TestOpenAIRequestNormalizer:
 
         assert result[0]["name"] == "Alice"
 
-    def test_normalize_messages_with_function_call(self) -> None:
+    def test_normalize_messages_with_function_call(self, normalizer) -> None:
         """Test normalizing messages with function_call field."""
-        normalizer = OpenAIRequestNormalizer()
         function_call = {"name": "get_weather", "arguments": '{"location": "NYC"}'}
         messages = [
             Message(role="assistant", content=None, function_call=function_call),
@@ -125,9 +124,8 @@ class TestOpenAIRequestNormalizer:
 
         assert result[0]["function_call"] == function_call
 
-    def test_normalize_messages_with_tool_calls(self) -> None:
+    def test_normalize_messages_with_tool_calls(self, normalizer) -> None:
         """Test normalizing messages with tool_calls field."""
-        normalizer = OpenAIRequestNormalizer()
         tool_calls = [
             {
                 "id": "call_123",
@@ -143,16 +141,14 @@ class TestOpenAIRequestNormalizer:
 
         assert result[0]["tool_calls"] == tool_calls
 
-    def test_normalize_messages_empty_list_raises_error(self) -> None:
+    def test_normalize_messages_empty_list_raises_error(self, normalizer) -> None:
         """Test that normalizing empty messages list raises ValidationError."""
-        normalizer = OpenAIRequestNormalizer()
 
         with pytest.raises(ValidationError, match="cannot be empty"):
             normalizer.normalize_messages([])
 
-    def test_normalize_excludes_none_parameters(self) -> None:
+    def test_normalize_excludes_none_parameters(self, normalizer) -> None:
         """Test that None parameters are excluded from result."""
-        normalizer = OpenAIRequestNormalizer()
         request = UnifiedRequest(
             messages=[Message(role="user", content="Hello")],
             temperature=None,
@@ -165,40 +161,35 @@ class TestOpenAIRequestNormalizer:
         assert "max_tokens" not in result
         assert "messages" in result
 
-    def test_validate_model_support_gpt4(self) -> None:
+    def test_validate_model_support_gpt4(self, normalizer) -> None:
         """Test model validation for GPT-4 models."""
-        normalizer = OpenAIRequestNormalizer()
 
         assert normalizer.validate_model_support("gpt-4") is True
         assert normalizer.validate_model_support("gpt-4-turbo") is True
         assert normalizer.validate_model_support("gpt-4o") is True
         assert normalizer.validate_model_support("gpt-4-32k") is True
 
-    def test_validate_model_support_gpt35(self) -> None:
+    def test_validate_model_support_gpt35(self, normalizer) -> None:
         """Test model validation for GPT-3.5 models."""
-        normalizer = OpenAIRequestNormalizer()
 
         assert normalizer.validate_model_support("gpt-3.5-turbo") is True
         assert normalizer.validate_model_support("gpt-3.5-turbo-16k") is True
 
-    def test_validate_model_support_o1(self) -> None:
+    def test_validate_model_support_o1(self, normalizer) -> None:
         """Test model validation for O1 models."""
-        normalizer = OpenAIRequestNormalizer()
 
         assert normalizer.validate_model_support("o1-preview") is True
         assert normalizer.validate_model_support("o1-mini") is True
 
-    def test_validate_model_support_unsupported(self) -> None:
+    def test_validate_model_support_unsupported(self, normalizer) -> None:
         """Test model validation for unsupported models."""
-        normalizer = OpenAIRequestNormalizer()
 
         assert normalizer.validate_model_support("claude-3") is False
         assert normalizer.validate_model_support("gemini-pro") is False
         assert normalizer.validate_model_support("unknown-model") is False
 
-    def test_normalize_with_response_format(self) -> None:
+    def test_normalize_with_response_format(self, normalizer) -> None:
         """Test normalizing request with response_format parameter."""
-        normalizer = OpenAIRequestNormalizer()
         response_format = {"type": "json_object"}
         request = UnifiedRequest(
             messages=[Message(role="user", content="Hello")],
@@ -209,9 +200,8 @@ class TestOpenAIRequestNormalizer:
 
         assert result["response_format"] == response_format
 
-    def test_normalize_with_tools(self) -> None:
+    def test_normalize_with_tools(self, normalizer) -> None:
         """Test normalizing request with tools parameter."""
-        normalizer = OpenAIRequestNormalizer()
         tools = [
             {
                 "type": "function",
@@ -231,9 +221,8 @@ class TestOpenAIRequestNormalizer:
 
         assert result["tools"] == tools
 
-    def test_normalize_with_tool_choice(self) -> None:
+    def test_normalize_with_tool_choice(self, normalizer) -> None:
         """Test normalizing request with tool_choice parameter."""
-        normalizer = OpenAIRequestNormalizer()
         request = UnifiedRequest(
             messages=[Message(role="user", content="Hello")],
             tool_choice="auto",
@@ -243,9 +232,8 @@ class TestOpenAIRequestNormalizer:
 
         assert result["tool_choice"] == "auto"
 
-    def test_normalize_conversation(self) -> None:
+    def test_normalize_conversation(self, normalizer) -> None:
         """Test normalizing a multi-turn conversation."""
-        normalizer = OpenAIRequestNormalizer()
         request = UnifiedRequest(
             messages=[
                 Message(role="system", content="You are helpful"),
@@ -82,6 +82,13 @@ class TestModelValidator:
             ModelValidator.validate("openai", "invalid-model", strict=True)
         assert "not supported" in str(exc_info.value)
 
+    def test_validate_invalid_model_strict_lists_supported(self) -> None:
+        """Test that the strict-mode error reports the supported model list."""
+        with pytest.raises(ValidationError) as exc_info:
+            ModelValidator.validate("openai", "invalid-model", strict=True)
+        supported = exc_info.value.details["supported_models"]
+        assert supported == ModelValidator.get_supported_models("openai")
+
     def test_validate_invalid_model_non_strict(self) -> None:
         """Test that invalid model in non-strict mode is allowed."""
         assert ModelValidator.validate("openai", "new-future-model", strict=False) is True
@@ -5,17 +5,59 @@ Tests the VertexAIProvider implementation including request normalization,
 response normalization, error handling, and integration with circuit breakers.
 """
 
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
-from google.genai import types
-
-from flexiai.exceptions import AuthenticationError, ProviderException, ValidationError
+from google.genai.types import FinishReason
+
+from flexiai.exceptions import (
+    AuthenticationError,
+    ProviderException,
+    RateLimitError,
+    ValidationError,
+)
 from flexiai.models import Message, ProviderConfig, UnifiedRequest
+from flexiai.providers import vertexai_provider as vertexai_provider_module
 from flexiai.providers.vertexai_provider import VertexAIProvider
 
+# Shared fields for the ProviderConfig instances built in initialization tests
+_BASE_CONFIG_KWARGS = {
+    "name": "vertexai",
+    "api_key": "not-used",  # Placeholder to force ADC path
+    "model": "gemini-2.0-flash",
+    "priority": 1,
+}
+
+
+def _mock_response(
+    text="Response",
+    prompt_tokens=5,
+    completion_tokens=3,
+    finish_reason=FinishReason.STOP,
+):
+    """Build a ``generate_content`` response stub with a single candidate.
+
+    The provider only reads attributes from the response, so a plain
+    ``SimpleNamespace`` tree is enough and avoids Mock's attribute machinery.
+    """
+    return SimpleNamespace(
+        text=text,
+        candidates=[
+            SimpleNamespace(
+                content=SimpleNamespace(parts=[SimpleNamespace(text=text)], role="model"),
+                finish_reason=finish_reason,
+            )
+        ],
+        usage_metadata=SimpleNamespace(
+            prompt_token_count=prompt_tokens,
+            candidates_token_count=completion_tokens,
+            total_token_count=prompt_tokens + completion_tokens,
+        ),
+    )
+
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def vertexai_config():
     """Fixture for Vertex AI provider configuration."""
     return ProviderConfig(
@@ -30,40 +72,88 @@ def vertexai_config():
     )
 
 
+@pytest.fixture(autouse=True, scope="module")
+def mock_genai_client_cls():
+    """Patch the genai Client class once for every test in this module."""
+    mock_cls = Mock()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(vertexai_provider_module.genai, "Client", mock_cls)
+        yield mock_cls
+
+
 @pytest.fixture
-def vertexai_provider(vertexai_config):
-    """Fixture for Vertex AI provider with mocked client."""
-    with patch("flexiai.providers.vertexai_provider.genai.Client") as mock_client_class:
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-        provider = VertexAIProvider(vertexai_config)
-        provider.client = mock_client
-        yield provider
+def genai_client_cls(mock_genai_client_cls):
+    """The patched genai Client class, reset for tests that inspect its calls."""
+    mock_genai_client_cls.reset_mock(return_value=True, side_effect=True)
+    return mock_genai_client_cls
+
+
+@pytest.fixture(scope="module")
+def shared_vertexai_provider(vertexai_config, mock_genai_client_cls):
+    """Vertex AI provider with a mocked client, built once per module."""
+    return VertexAIProvider(vertexai_config)
+
+
+@pytest.fixture(scope="module")
+def simple_user_request():
+    """Single-message request shared read-only across tests; copy before changing."""
+    return UnifiedRequest(messages=[Message(role="user", content="Hello")])
+
+
+@pytest.fixture
+def vertexai_provider(shared_vertexai_provider):
+    """Fixture for Vertex AI provider with its client mock reset for each test."""
+    shared_vertexai_provider.client.reset_mock(return_value=True, side_effect=True)
+    return shared_vertexai_provider
 
 
 class TestVertexAIProviderInitialization:
     """Tests for Vertex AI provider initialization."""
 
-    def test_initialization_success(self, vertexai_config):
-        """Test successful initialization with valid config."""
-        with patch("flexiai.providers.vertexai_provider.genai.Client") as mock_client_class:
-            mock_client = Mock()
-            mock_client_class.return_value = mock_client
+    @pytest.mark.parametrize(
+        "config_dict,env,expected_project,expected_location",
+        [
+            (
+                {"project": "test-project-123", "location": "us-central1"},
+                {},
+                "test-project-123",
+                "us-central1",
+            ),
+            (
+                {},  # Will use env vars
+                {
+                    "GOOGLE_CLOUD_PROJECT": "env-project-456",
+                    "GOOGLE_CLOUD_LOCATION": "europe-west1",
+                },
+                "env-project-456",
+                "europe-west1",
+            ),
+            ({"project": "test-project"}, {}, "test-project", "us-central1"),
+        ],
+        ids=["explicit_config", "env_vars", "default_location"],
+    )
+    def test_initialization(
+        self, genai_client_cls, monkeypatch, config_dict, env, expected_project, expected_location
+    ):
+        """Test project and location resolution from config, env vars and defaults."""
+        monkeypatch.delenv("GOOGLE_CLOUD_LOCATION", raising=False)
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
 
-            provider = VertexAIProvider(vertexai_config)
+        provider = VertexAIProvider(ProviderConfig(**_BASE_CONFIG_KWARGS, config=config_dict))
 
-            assert provider.name == "vertexai"
-            assert provider.config.model == "gemini-2.0-flash"
-            assert provider.project == "test-project-123"
-            assert provider.location == "us-central1"
-            assert provider.client is not None
+        assert provider.name == "vertexai"
+        assert provider.config.model == "gemini-2.0-flash"
+        assert provider.project == expected_project
+        assert provider.location == expected_location
+        assert provider.client is genai_client_cls.return_value
 
-            # Verify client was initialized with correct parameters
-            mock_client_class.assert_called_once()
-            call_kwargs = mock_client_class.call_args[1]
-            assert call_kwargs["vertexai"] is True
-            assert call_kwargs["project"] == "test-project-123"
-            assert call_kwargs["location"] == "us-central1"
+        # Verify client was initialized with correct parameters
+        genai_client_cls.assert_called_once()
+        call_kwargs = genai_client_cls.call_args[1]
+        assert call_kwargs["vertexai"] is True
+        assert call_kwargs["project"] == expected_project
+        assert call_kwargs["location"] == expected_location
 
     def test_initialization_missing_project(self, monkeypatch):
         """Test initialization fails without project ID."""
@@ -71,72 +161,20 @@ class TestVertexAIProviderInitialization:
         monkeypatch.delenv("GOOGLE_CLOUD_PROJECT", raising=False)
         monkeypatch.delenv("GOOGLE_CLOUD_LOCATION", raising=False)
 
-        config = ProviderConfig(
-            name="vertexai",
-            api_key="not-used",  # Placeholder to force ADC path
-            model="gemini-2.0-flash",
-            priority=1,
-            config={},  # Missing project
-        )
+        config = ProviderConfig(**_BASE_CONFIG_KWARGS, config={})  # Missing project
 
         with pytest.raises(ValidationError, match="GCP project ID is required"):
             VertexAIProvider(config)
 
-    def test_initialization_from_env_vars(self, monkeypatch):
-        """Test initialization using environment variables."""
-        monkeypatch.setenv("GOOGLE_CLOUD_PROJECT", "env-project-456")
-        monkeypatch.setenv("GOOGLE_CLOUD_LOCATION", "europe-west1")
-
-        config = ProviderConfig(
-            name="vertexai",
-            api_key="not-used",
-            model="gemini-2.0-flash",
-            priority=1,
-            config={},  # Will use env vars
-        )
-
-        with patch("flexiai.providers.vertexai_provider.genai.Client") as mock_client_class:
-            mock_client = Mock()
-            mock_client_class.return_value = mock_client
-
-            provider = VertexAIProvider(config)
-
-            assert provider.project == "env-project-456"
-            assert provider.location == "europe-west1"
-
-    def test_initialization_default_location(self):
-        """Test default location is us-central1."""
-        config = ProviderConfig(
-            name="vertexai",
-            api_key="not-used",
-            model="gemini-2.0-flash",
-            priority=1,
-            config={"project": "test-project"},  # No location specified
-        )
-
-        with patch("flexiai.providers.vertexai_provider.genai.Client") as mock_client_class:
-            mock_client = Mock()
-            mock_client_class.return_value = mock_client
-
-            provider = VertexAIProvider(config)
-
-            assert provider.location == "us-central1"
-
 
 class TestVertexAIChatCompletion:
     """Tests for Vertex AI chat completion."""
 
     def test_basic_chat_completion(self, vertexai_provider):
         """Test basic chat completion request."""
-        mock_response = Mock()
-        mock_response.text = "Hello! How can I help you?"
-        mock_response.candidates = [Mock()]
-        mock_response.candidates[0].content.parts = [Mock(text="Hello! How can I help you?")]
-        mock_response.candidates[0].content.role = "model"
-        mock_response.candidates[0].finish_reason = types.FinishReason.STOP
-        mock_response.usage_metadata.prompt_token_count = 10
-        mock_response.usage_metadata.candidates_token_count = 8
-        mock_response.usage_metadata.total_token_count = 18
+        mock_response = _mock_response(
+            "Hello! How can I help you?", prompt_tokens=10, completion_tokens=8
+        )
 
         vertexai_provider.client.models.generate_content.return_value = mock_response
 
@@ -155,15 +193,7 @@ class TestVertexAIChatCompletion:
 
     def test_chat_completion_with_system_message(self, vertexai_provider):
         """Test chat completion with system message."""
-        mock_response = Mock()
-        mock_response.text = "Response"
-        mock_response.candidates = [Mock()]
-        mock_response.candidates[0].content.parts = [Mock(text="Response")]
-        mock_response.candidates[0].content.role = "model"
-        mock_response.candidates[0].finish_reason = types.FinishReason.STOP
-        mock_response.usage_metadata.prompt_token_count = 15
-        mock_response.usage_metadata.candidates_token_count = 5
-        mock_response.usage_metadata.total_token_count = 20
+        mock_response = _mock_response(prompt_tokens=15, completion_tokens=5)
 
         vertexai_provider.client.models.generate_content.return_value = mock_response
 
@@ -188,15 +218,7 @@ class TestVertexAIChatCompletion:
 
     def test_chat_completion_with_multi_turn_conversation(self, vertexai_provider):
         """Test chat completion with multi-turn conversation."""
-        mock_response = Mock()
-        mock_response.text = "Final response"
-        mock_response.candidates = [Mock()]
-        mock_response.candidates[0].content.parts = [Mock(text="Final response")]
-        mock_response.candidates[0].content.role = "model"
-        mock_response.candidates[0].finish_reason = types.FinishReason.STOP
-        mock_response.usage_metadata.prompt_token_count = 30
-        mock_response.usage_metadata.candidates_token_count = 10
-        mock_response.usage_metadata.total_token_count = 40
+        mock_response = _mock_response("Final response", prompt_tokens=30, completion_tokens=10)
 
         vertexai_provider.client.models.generate_content.return_value = mock_response
 
@@ -218,42 +240,42 @@ class TestVertexAIChatCompletion:
 class TestVertexAIErrorHandling:
     """Tests for Vertex AI error handling."""
 
-    def test_api_error_handling(self, vertexai_provider):
+    def test_api_error_handling(self, vertexai_provider, simple_user_request):
         """Test handling of generic API errors."""
         vertexai_provider.client.models.generate_content.side_effect = Exception("API Error")
 
-        request = UnifiedRequest(messages=[Message(role="user", content="Hello")])
-
         with pytest.raises(ProviderException, match="Vertex AI request failed"):
-            vertexai_provider.chat_completion(request)
-
-    def test_authentication_error_handling(self, vertexai_provider):
-        """Test handling of authentication errors."""
-        vertexai_provider.client.models.generate_content.side_effect = Exception(
-            "Permission denied"
-        )
+            vertexai_provider.chat_completion(simple_user_request)
+
+    @pytest.mark.parametrize(
+        "message,expected_exc,match",
+        [
+            ("Quota exceeded", RateLimitError, "Vertex AI rate limit exceeded"),
+            ("Permission denied", AuthenticationError, "Vertex AI authentication failed"),
+            ("Invalid argument", ValidationError, "Vertex AI request validation failed"),
+            ("Boom", ProviderException, "Vertex AI request failed"),
+        ],
+        ids=["rate_limit", "authentication", "validation", "generic"],
+    )
+    def test_handle_error_mapping(self, vertexai_provider, message, expected_exc, match):
+        """Test error messages are mapped to FlexiAI exceptions without a request."""
+        error = Exception(message)
 
-        request = UnifiedRequest(messages=[Message(role="user", content="Hello")])
+        with pytest.raises(expected_exc, match=match) as exc_info:
+            vertexai_provider._handle_error(error)
 
-        with pytest.raises(AuthenticationError, match="Vertex AI authentication failed"):
-            vertexai_provider.chat_completion(request)
+        assert exc_info.value.__cause__ is error
 
-    def test_missing_credentials_error(self):
+    def test_missing_credentials_error(self, genai_client_cls, monkeypatch):
         """Test error when credentials are not available."""
-        config = ProviderConfig(
-            name="vertexai",
-            api_key="not-used",
-            model="gemini-2.0-flash",
-            priority=1,
-            config={"project": "test-project"},
+        config = ProviderConfig(**_BASE_CONFIG_KWARGS, config={"project": "test-project"})
+
+        monkeypatch.setattr(
+            genai_client_cls, "side_effect", Exception("Could not load default credentials")
         )
 
-        with patch(
-            "flexiai.providers.vertexai_provider.genai.Client",
-            side_effect=Exception("Could not load default credentials"),
-        ):
-            with pytest.raises(AuthenticationError, match="Failed to initialize Vertex AI client"):
-                VertexAIProvider(config)
+        with pytest.raises(AuthenticationError, match="Failed to initialize Vertex AI client"):
+            VertexAIProvider(config)
 
 
 class TestVertexAIRequestNormalization:
@@ -261,18 +283,6 @@ class TestVertexAIRequestNormalization:
 
     def test_parameter_mapping(self, vertexai_provider):
         """Test that request parameters are correctly mapped."""
-        mock_response = Mock()
-        mock_response.text = "Response"
-        mock_response.candidates = [Mock()]
-        mock_response.candidates[0].content.parts = [Mock(text="Response")]
-        mock_response.candidates[0].content.role = "model"
-        mock_response.candidates[0].finish_reason = types.FinishReason.STOP
-        mock_response.usage_metadata.prompt_token_count = 5
-        mock_response.usage_metadata.candidates_token_count = 3
-        mock_response.usage_metadata.total_token_count = 8
-
-        vertexai_provider.client.models.generate_content.return_value = mock_response
-
         request = UnifiedRequest(
             messages=[Message(role="user", content="Test")],
             max_tokens=100,
@@ -280,29 +290,16 @@ class TestVertexAIRequestNormalization:
             top_p=0.9,
         )
 
-        vertexai_provider.chat_completion(request)
+        normalized = vertexai_provider.request_normalizer.normalize(request)
 
-        # Verify the call was made with correct parameters
-        call_kwargs = vertexai_provider.client.models.generate_content.call_args[1]
-        _ = call_kwargs.get("config") or call_kwargs.get("generationConfig", {})
-
-        # The actual parameter names in the call might vary
-        assert vertexai_provider.client.models.generate_content.called
+        assert normalized["generationConfig"] == {
+            "temperature": 0.8,
+            "maxOutputTokens": 100,
+            "topP": 0.9,
+        }
 
     def test_role_mapping(self, vertexai_provider):
         """Test that roles are correctly mapped (assistant -> model)."""
-        mock_response = Mock()
-        mock_response.text = "Response"
-        mock_response.candidates = [Mock()]
-        mock_response.candidates[0].content.parts = [Mock(text="Response")]
-        mock_response.candidates[0].content.role = "model"
-        mock_response.candidates[0].finish_reason = types.FinishReason.STOP
-        mock_response.usage_metadata.prompt_token_count = 5
-        mock_response.usage_metadata.candidates_token_count = 3
-        mock_response.usage_metadata.total_token_count = 8
-
-        vertexai_provider.client.models.generate_content.return_value = mock_response
-
         request = UnifiedRequest(
             messages=[
                 Message(role="user", content="Hello"),
@@ -311,57 +308,46 @@ class TestVertexAIRequestNormalization:
             ],
         )
 
-        vertexai_provider.chat_completion(request)
+        normalized = vertexai_provider.request_normalizer.normalize(request)
 
-        # Verify normalizer was called and roles were mapped
-        assert vertexai_provider.client.models.generate_content.called
+        assert [content["role"] for content in normalized["contents"]] == [
+            "user",
+            "model",
+            "user",
+        ]
 
 
 class TestVertexAIResponseNormalization:
     """Tests for Vertex AI response normalization."""
 
-    def test_finish_reason_mapping(self, vertexai_provider):
+    @pytest.mark.parametrize(
+        "vertex_reason,expected_reason",
+        [
+            (FinishReason.STOP, "stop"),
+            (FinishReason.MAX_TOKENS, "length"),
+            (FinishReason.SAFETY, "content_filter"),
+        ],
+        ids=["stop", "max_tokens", "safety"],
+    )
+    def test_finish_reason_mapping(
+        self, vertexai_provider, simple_user_request, vertex_reason, expected_reason
+    ):
         """Test that finish reasons are correctly mapped."""
-        finish_reasons_to_test = [
-            (types.FinishReason.STOP, "stop"),
-            (types.FinishReason.MAX_TOKENS, "length"),
-            (types.FinishReason.SAFETY, "content_filter"),
-        ]
+        mock_response = _mock_response(finish_reason=vertex_reason)
 
-        for vertex_reason, expected_reason in finish_reasons_to_test:
-            mock_response = Mock()
-            mock_response.text = "Response"
-            mock_response.candidates = [Mock()]
-            mock_response.candidates[0].content.parts = [Mock(text="Response")]
-            mock_response.candidates[0].content.role = "model"
-            mock_response.candidates[0].finish_reason = vertex_reason
-            mock_response.usage_metadata.prompt_token_count = 5
-            mock_response.usage_metadata.candidates_token_count = 3
-            mock_response.usage_metadata.total_token_count = 8
-
-            vertexai_provider.client.models.generate_content.return_value = mock_response
+        vertexai_provider.client.models.generate_content.return_value = mock_response
 
-            request = UnifiedRequest(messages=[Message(role="user", content="Test")])
-            response = vertexai_provider.chat_completion(request)
+        response = vertexai_provider.chat_completion(simple_user_request)
 
-            assert response.finish_reason == expected_reason
+        assert response.finish_reason == expected_reason
 
-    def test_usage_metadata_extraction(self, vertexai_provider):
+    def test_usage_metadata_extraction(self, vertexai_provider, simple_user_request):
         """Test that usage metadata is correctly extracted."""
-        mock_response = Mock()
-        mock_response.text = "Response"
-        mock_response.candidates = [Mock()]
-        mock_response.candidates[0].content.parts = [Mock(text="Response")]
-        mock_response.candidates[0].content.role = "model"
-        mock_response.candidates[0].finish_reason = types.FinishReason.STOP
-        mock_response.usage_metadata.prompt_token_count = 123
-        mock_response.usage_metadata.candidates_token_count = 456
-        mock_response.usage_metadata.total_token_count = 579
+        mock_response = _mock_response(prompt_tokens=123, completion_tokens=456)
 
         vertexai_provider.client.models.generate_content.return_value = mock_response
 
-        request = UnifiedRequest(messages=[Message(role="user", content="Test")])
-        response = vertexai_provider.chat_completion(request)
+        response = vertexai_provider.chat_completion(simple_user_request)
 
         assert response.usage.prompt_tokens == 123
         assert response.usage.completion_tokens == 456
@@ -373,27 +359,18 @@ class TestVertexAIHealthCheck:
 
     def test_health_check_healthy(self, vertexai_provider):
         """Test health check when provider is healthy."""
-        mock_response = Mock()
-        mock_response.text = "Hi"
-        mock_response.candidates = [Mock()]
-        mock_response.candidates[0].content.parts = [Mock(text="Hi")]
-        mock_response.candidates[0].content.role = "model"
-        mock_response.candidates[0].finish_reason = types.FinishReason.STOP
-        mock_response.usage_metadata.prompt_token_count = 1
-        mock_response.usage_metadata.candidates_token_count = 1
-        mock_response.usage_metadata.total_token_count = 2
-
-        vertexai_provider.client.models.generate_content.return_value = mock_response
-
-        result = vertexai_provider.health_check()
+        with patch.object(vertexai_provider, "chat_completion", return_value=Mock()) as mock_chat:
+            result = vertexai_provider.health_check()
 
         assert result is True
+        mock_chat.assert_called_once()
 
     def test_health_check_unhealthy(self, vertexai_provider):
         """Test health check when provider is unhealthy."""
-        vertexai_provider.client.models.generate_content.side_effect = Exception("Connection error")
-
-        result = vertexai_provider.health_check()
+        with patch.object(
+            vertexai_provider, "chat_completion", side_effect=Exception("Connection error")
+        ):
+            result = vertexai_provider.health_check()
 
         assert result is False
 
@@ -405,20 +382,20 @@ class TestVertexAICapabilities:
         """Test getting provider capabilities."""
         capabilities = vertexai_provider.get_capabilities()
 
-        assert capabilities["name"] == "vertexai"
-        assert capabilities["supports_streaming"] is True
-        assert capabilities["supports_functions"] is True
-        assert capabilities["authentication"] == "gcp-adc"
-        assert capabilities["project"] == "test-project-123"
-        assert capabilities["location"] == "us-central1"
-        assert "max_tokens" in capabilities
-        assert "context_window" in capabilities
+        expected_subset = {
+            "name": "vertexai",
+            "supports_streaming": True,
+            "supports_functions": True,
+            "authentication": "gcp-adc",
+            "project": "test-project-123",
+            "location": "us-central1",
+        }
+        assert expected_subset.items() <= capabilities.items()
+        assert {"max_tokens", "context_window"} <= capabilities.keys()
 
     def test_provider_repr(self, vertexai_provider):
         """Test string representation of provider."""
-        repr_str = repr(vertexai_provider)
-
-        assert "VertexAIProvider" in repr_str
-        assert "gemini-2.0-flash" in repr_str
-        assert "test-project-123" in repr_str
-        assert "us-central1" in repr_str
+        assert repr(vertexai_provider) == (
+            "VertexAIProvider(model='gemini-2.0-flash', project='test-project-123', "
+            "location='us-central1', priority=1)"
+        )